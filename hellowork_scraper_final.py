@@ -8,20 +8,192 @@ Script pour extraire les offres d'emploi de HelloWork et générer des lettres d
 
 import os
 import sys
-import time
 import json
+import gzip
+import time
+import hashlib
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    # selectolax (moteur Lexbor) est bien plus rapide pour la sélection CSS ; BeautifulSoup reste en secours
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 import re
+import string
+import logging
 import argparse
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 BASE_URL = "https://www.hellowork.com"
 SEARCH_URL_PATTERN = "https://www.hellowork.com/fr-fr/emploi/recherche.html?k={job}&l={location}"
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
+REQUEST_TIMEOUT = 10
+# Taille maximale lue pour une page (octets), au-delà la page est tronquée
+MAX_PAGE_BYTES = 2_000_000
+# Nombre maximum de requêtes simultanées vers HelloWork
+MAX_WORKERS = 8
+# Cache disque des pages d'offres (HTML compressé, une entrée par URL)
+CACHE_DIR = os.path.join(".cache", "hellowork")
+CACHE_TTL = 24 * 3600
+
+# Types de contrat attribués quand la carte de l'offre n'en affiche pas
+UNKNOWN_CONTRACT_TYPES = ("Non spécifié", "À déterminer", "Potentiellement alternance/apprentissage")
+
+# Expressions régulières compilées une seule fois
+COMPANY_RE = re.compile(r'chez\s+(\w+)')
+LOCATION_RE = re.compile(r'à\s+([^,]+)')
+ALTERNANCE_RE = re.compile(r'altern|apprentissage', re.IGNORECASE)
+UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+
+# Modèle de lettre de motivation
+LETTER_TEMPLATE = string.Template("""
+$today
+
+$destinataire
+$company
+
+Objet : $objet
+
+Madame, Monsieur,
+
+Suite à votre offre d'emploi pour le poste de $title $location, je vous présente ma candidature avec enthousiasme.
+
+Mon profil correspond aux qualifications que vous recherchez comme le montre mon CV ci-joint.
+
+$cv_text
+
+$parcours_text
+
+Particulièrement intéressé(e) par $company, je souhaite mettre à profit mon expertise pour contribuer à vos projets. Votre recherche de $title correspond parfaitement à mon parcours professionnel et à mes aspirations.
+
+Je serais ravi(e) de vous rencontrer pour vous présenter ma motivation et mes compétences lors d'un entretien.
+
+Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.
+
+[Votre nom]
+[Vos coordonnées]
+        """)
+
+# Classes des blocs pouvant contenir la description d'une offre
+DESCRIPTION_CLASSES = {"job-description", "description", "offer-description", "tw-prose", "main-content"}
+
+def _is_listing_tag(name, attrs):
+    """Garde uniquement les cartes d'offres et les liens vers des offres lors de l'analyse."""
+    return ((name == "div" and attrs.get("data-cy") == "serpCard")
+            or (name == "a" and "/emplois/" in (attrs.get("href") or "")))
+
+def _is_description_tag(name, attrs):
+    """Garde uniquement les blocs susceptibles de contenir la description d'une offre."""
+    if name in ("main", "article", "p"):
+        return True
+    if name not in ("div", "section"):
+        return False
+    return (attrs.get("data-testid") == "job-description"
+            or attrs.get("data-cy") == "jobDescription"
+            or not DESCRIPTION_CLASSES.isdisjoint((attrs.get("class") or "").split()))
+
+# Filtres appliqués pendant l'analyse : le reste de la page n'est jamais construit
+LISTING_STRAINER = SoupStrainer(_is_listing_tag)
+DESCRIPTION_STRAINER = SoupStrainer(_is_description_tag)
+
+def parse_html(content, strainer=None):
+    """Analyse une page HTML avec selectolax si disponible, sinon avec BeautifulSoup + lxml."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(content)
+    return BeautifulSoup(content, "lxml", parse_only=strainer)
 
-def scrape_job_listings(job_title, location="", max_pages=1):
+def css_all(node, selector):
+    """Retourne tous les éléments correspondant au sélecteur CSS."""
+    return node.css(selector) if LexborHTMLParser is not None else node.select(selector)
+
+def css_first(node, selector):
+    """Retourne le premier élément correspondant au sélecteur CSS, ou None."""
+    return node.css_first(selector) if LexborHTMLParser is not None else node.select_one(selector)
+
+def node_text(node):
+    """Retourne le texte d'un élément sans les espaces superflus."""
+    return node.text(strip=True) if LexborHTMLParser is not None else node.get_text(strip=True)
+
+def node_attr(node, name):
+    """Retourne la valeur d'un attribut d'un élément, ou None."""
+    return node.attributes.get(name) if LexborHTMLParser is not None else node.get(name)
+
+@dataclass(slots=True)
+class JobOffer:
+    """Offre d'emploi extraite d'une page de résultats HelloWork."""
+    title: str
+    company: str
+    location: str
+    description: str
+    link: str
+    contract_type: str
+    is_alternance: bool
+
+# Session HTTP partagée : réutilise les connexions (keep-alive) vers HelloWork
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+
+def fetch_page(url):
+    """
+    Télécharge une page en flux, sans dépasser MAX_PAGE_BYTES.
+    
+    Args:
+        url (str): URL de la page
+        
+    Returns:
+        tuple: (code HTTP, contenu brut de la page en octets)
+    """
+    with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        if response.status_code != 200:
+            return response.status_code, b""
+        content = response.raw.read(MAX_PAGE_BYTES + 1, decode_content=True)
+    if len(content) > MAX_PAGE_BYTES:
+        logger.warning("Page tronquée à %d octets: %s", MAX_PAGE_BYTES, url)
+        content = content[:MAX_PAGE_BYTES]
+    return response.status_code, content
+
+def _cache_path(url):
+    """Retourne le chemin du fichier de cache associé à une URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html.gz")
+
+def _read_cached_page(url):
+    """Retourne le HTML en cache pour cette URL s'il a moins de CACHE_TTL secondes, sinon None."""
+    path = _cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL:
+            return None
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    except (OSError, EOFError):
+        return None
+
+def _write_cached_page(url, content):
+    """Enregistre le HTML d'une page dans le cache disque."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with gzip.open(_cache_path(url), "wb") as f:
+            f.write(content)
+    except OSError as e:
+        logger.warning("Impossible d'écrire le cache pour %s: %s", url, e)
+
+def scrape_job_listings(job_title, location="", max_pages=1, debug=False):
     """
     Scrape les offres d'emploi depuis HelloWork.
     
@@ -29,9 +201,10 @@ def scrape_job_listings(job_title, location="", max_pages=1):
         job_title (str): Le titre du poste recherché
         location (str, optional): La localisation. Par défaut "".
         max_pages (int, optional): Nombre maximum de pages à scraper. Par défaut 1.
+        debug (bool, optional): Sauvegarder le HTML de chaque page. Par défaut False.
     
     Returns:
-        list: Liste des offres d'emploi
+        list[JobOffer]: Liste des offres d'emploi
     """
     job_listings = []
     
@@ -42,59 +215,55 @@ def scrape_job_listings(job_title, location="", max_pages=1):
     # Construire l'URL de recherche
     search_url = SEARCH_URL_PATTERN.format(job=job_param, location=location_param)
     
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-    }
+    logger.info("Recherche d'offres pour: %s", job_title)
+    logger.info("URL de recherche: %s", search_url)
+    
+    # Ajout du paramètre de pagination si nécessaire
+    page_urls = [search_url if page == 1 else f"{search_url}&page={page}" for page in range(1, max_pages + 1)]
     
-    print(f"Recherche d'offres pour: {job_title}")
-    print(f"URL de recherche: {search_url}")
+    # Télécharger toutes les pages en parallèle, l'analyse reste séquentielle
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        page_futures = [executor.submit(fetch_page, page_url) for page_url in page_urls]
     
-    for page in range(1, max_pages + 1):
+    for page, page_future in enumerate(page_futures, 1):
         try:
-            # Ajout du paramètre de pagination si nécessaire
-            if page > 1:
-                page_url = f"{search_url}&page={page}"
-            else:
-                page_url = search_url
-            
-            print(f"Scraping de la page {page}...")
-            response = requests.get(page_url, headers=headers)
+            logger.info("Scraping de la page %d...", page)
+            status_code, content = page_future.result()
             
-            if response.status_code != 200:
-                print(f"Erreur lors de la requête: {response.status_code}")
+            if status_code != 200:
+                logger.error("Erreur lors de la requête: %s", status_code)
                 break
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_html(content, LISTING_STRAINER)
             
             # Sauvegarder la page pour analyse (en mode debug)
-            with open(f"debug_page_{page}.html", "w", encoding="utf-8") as f:
-                f.write(response.text)
-            print(f"Page {page} sauvegardée pour analyse")
+            if debug:
+                with open(f"debug_page_{page}.html", "wb") as f:
+                    f.write(content)
+                logger.debug("Page %d sauvegardée pour analyse", page)
             
             # 1. Chercher des éléments qui pourraient contenir des offres d'emploi par data-cy="serpCard"
-            job_cards = soup.select('div[data-cy="serpCard"]')
+            job_cards = css_all(soup, 'div[data-cy="serpCard"]')
             
             # 2. Si aucune offre trouvée, chercher des liens d'offres
             if not job_cards:
-                print("Pas d'offres trouvées avec les sélecteurs standards, essai avec les liens...")
-                job_links = soup.find_all('a', href=lambda href: href and '/emplois/' in href)
+                logger.info("Pas d'offres trouvées avec les sélecteurs standards, essai avec les liens...")
+                job_links = css_all(soup, 'a[href*="/emplois/"]')
                 
                 # Filtrer pour ne garder que les liens qui semblent être des offres
-                job_links = [link for link in job_links if not any(exclude in link.get('href', '') for exclude in ['recherche', 'page='])]
+                job_links = [link for link in job_links if not any(exclude in (node_attr(link, 'href') or '') for exclude in ['recherche', 'page='])]
                 
                 if job_links:
-                    print(f"Trouvé {len(job_links)} liens directs vers des offres")
+                    logger.info("Trouvé %d liens directs vers des offres", len(job_links))
                 
                 for link in job_links:
-                    href = link.get('href')
-                    title = link.get_text(strip=True)
+                    href = node_attr(link, 'href')
+                    title = node_text(link)
                     
                     if not title:
-                        title_elem = link.find(['h2', 'h3', 'p'])
+                        title_elem = css_first(link, 'h2, h3, p')
                         if title_elem:
-                            title = title_elem.get_text(strip=True)
+                            title = node_text(title_elem)
                         else:
                             title = "Titre non disponible"
                     
@@ -105,257 +274,260 @@ def scrape_job_listings(job_title, location="", max_pages=1):
                     company = "Non spécifié"
                     job_location = location or "Non spécifié"
                     
-                    aria_label = link.get('aria-label')
+                    aria_label = node_attr(link, 'aria-label')
                     if aria_label:
-                        company_match = re.search(r'chez\s+(\w+)', aria_label)
+                        company_match = COMPANY_RE.search(aria_label)
                         if company_match:
                             company = company_match.group(1)
                         
-                        location_match = re.search(r'à\s+([^,]+)', aria_label)
+                        location_match = LOCATION_RE.search(aria_label)
                         if location_match:
                             job_location = location_match.group(1)
                     
                     # Vérifier si c'est potentiellement une alternance basé sur le titre
-                    is_alternance = False
-                    contract_type = "À déterminer"
-                    if 'altern' in title.lower() or 'apprentissage' in title.lower():
-                        is_alternance = True
-                        contract_type = "Potentiellement alternance/apprentissage"
+                    is_alternance = bool(ALTERNANCE_RE.search(title))
+                    contract_type = "Potentiellement alternance/apprentissage" if is_alternance else "À déterminer"
                     
-                    job_listings.append({
-                        "title": title,
-                        "company": company,
-                        "location": job_location,
-                        "description": f"Type de contrat: {contract_type}",
-                        "link": full_url,
-                        "contract_type": contract_type,
-                        "is_alternance": is_alternance
-                    })
+                    job_listings.append(JobOffer(
+                        title=title,
+                        company=company,
+                        location=job_location,
+                        description=f"Type de contrat: {contract_type}",
+                        link=full_url,
+                        contract_type=contract_type,
+                        is_alternance=is_alternance
+                    ))
             
             # 3. Si des offres ont été trouvées avec les sélecteurs standards
             else:
-                print(f"Nombre d'offres trouvées sur la page {page}: {len(job_cards)}")
+                logger.info("Nombre d'offres trouvées sur la page %d: %d", page, len(job_cards))
                 
                 for job in job_cards:
                     try:
                         # Trouver le lien principal de l'offre
-                        link_element = job.select_one('a[href*="/emplois/"]')
+                        link_element = css_first(job, 'a[href*="/emplois/"]')
                         
                         if not link_element:
-                            link_element = job.find('a')
-                            if not link_element or not link_element.get('href'):
+                            link_element = css_first(job, 'a')
+                            if not link_element or not node_attr(link_element, 'href'):
                                 continue
                         
-                        link = link_element.get('href')
+                        link = node_attr(link_element, 'href')
                         
                         # S'assurer que le lien est absolu
                         if not link.startswith(('http://', 'https://')):
                             link = BASE_URL + link
                         
                         # Trouver le titre de l'offre
-                        title_element = job.select_one('p.tw-typo-l, p.tw-typo-xl, h3 p')
+                        title_element = css_first(job, 'p.tw-typo-l, p.tw-typo-xl, h3 p')
                         
                         if not title_element:
-                            title_element = job.find(['h3', 'h2', 'p.tw-typo-l'])
+                            title_element = css_first(job, 'h3, h2')
                             if not title_element:
                                 continue
                         
-                        title = title_element.get_text(strip=True)
+                        title = node_text(title_element)
                         
                         # Trouver le nom de l'entreprise
-                        company_element = job.select_one('p.tw-inline, p.tw-typo-s')
-                        company = company_element.get_text(strip=True) if company_element else "Non spécifié"
+                        company_element = css_first(job, 'p.tw-inline, p.tw-typo-s')
+                        company = node_text(company_element) if company_element else "Non spécifié"
                         
                         # Trouver la localisation
-                        location_element = job.select_one('div[data-cy="localisationCard"]')
-                        job_location = location_element.get_text(strip=True) if location_element else location or "Non spécifié"
+                        location_element = css_first(job, 'div[data-cy="localisationCard"]')
+                        job_location = node_text(location_element) if location_element else location or "Non spécifié"
                         
                         # Trouver des informations supplémentaires comme le type de contrat
-                        contract_element = job.select_one('div[data-cy="contractCard"]')
-                        contract_type = contract_element.get_text(strip=True) if contract_element else "Non spécifié"
+                        contract_element = css_first(job, 'div[data-cy="contractCard"]')
+                        contract_type = node_text(contract_element) if contract_element else "Non spécifié"
                         
                         # Chercher une description ou extrait
                         description = f"Type de contrat: {contract_type}"
                         
                         # Vérifier si c'est une alternance (peut être dans le titre ou type de contrat)
                         is_alternance = False
-                        if 'altern' in contract_type.lower() or 'apprentissage' in contract_type.lower():
+                        if ALTERNANCE_RE.search(contract_type):
                             is_alternance = True
                             description += " (Alternance)"
-                        elif 'altern' in title.lower() or 'apprentissage' in title.lower():
+                        elif ALTERNANCE_RE.search(title):
                             is_alternance = True
                             description += " (Alternance mentionnée dans le titre)"
                         
                         # Ajouter la date de publication si disponible
-                        date_element = job.select_one('div.tw-typo-s.tw-text-grey')
+                        date_element = css_first(job, 'div.tw-typo-s.tw-text-grey')
                         if date_element:
-                            description += f" | Publié: {date_element.get_text(strip=True)}"
+                            description += f" | Publié: {node_text(date_element)}"
                         
-                        job_listings.append({
-                            "title": title,
-                            "company": company,
-                            "location": job_location,
-                            "description": description,
-                            "link": link,
-                            "contract_type": contract_type,
-                            "is_alternance": is_alternance
-                        })
+                        job_listings.append(JobOffer(
+                            title=title,
+                            company=company,
+                            location=job_location,
+                            description=description,
+                            link=link,
+                            contract_type=contract_type,
+                            is_alternance=is_alternance
+                        ))
                         
                     except Exception as e:
-                        print(f"Erreur lors de l'extraction d'une offre: {str(e)}")
-            
-            # Pause pour éviter de surcharger le serveur
-            time.sleep(2)
+                        logger.warning("Erreur lors de l'extraction d'une offre: %s", e)
             
         except Exception as e:
-            print(f"Erreur lors du scraping de la page {page}: {str(e)}")
+            logger.error("Erreur lors du scraping de la page %d: %s", page, e)
     
-    print(f"Nombre total d'offres trouvées: {len(job_listings)}")
+    logger.info("Nombre total d'offres trouvées: %d", len(job_listings))
     return job_listings
 
+def extract_job_description(content):
+    """
+    Extrait la description d'une offre depuis le HTML de sa page.
+    
+    Args:
+        content (bytes): HTML de la page de l'offre
+        
+    Returns:
+        str: Description de l'offre
+    """
+    soup = parse_html(content, DESCRIPTION_STRAINER)
+    
+    # Tenter de trouver la section de description de l'offre
+    description_selectors = [
+        "div.job-description", 
+        "div.description", 
+        "div[data-testid='job-description']",
+        "div[data-cy='jobDescription']",
+        "section.job-description",
+        "div.offer-description",
+        "div.tw-prose"  # Nouveau sélecteur pour HelloWork
+    ]
+    
+    for selector in description_selectors:
+        description_element = css_first(soup, selector)
+        if description_element:
+            return node_text(description_element)
+    
+    # Si on ne trouve pas la description avec les sélecteurs spécifiques,
+    # essayons de récupérer tout le contenu principal
+    main_content = css_first(soup, "main, article, div.main-content")
+    if main_content:
+        return node_text(main_content)
+    
+    # Dernier recours: prendre tout ce qui ressemble à une description
+    all_paragraphs = css_all(soup, 'p')
+    if all_paragraphs and len(all_paragraphs) > 5:  # Au moins quelques paragraphes
+        content = "\n".join([text for text in map(node_text, all_paragraphs) if len(text) > 50])
+        if content:
+            return content
+    
+    return "Description non trouvée sur la page de l'offre."
+
+# Détails d'offres récupérés avec succès, mémorisés pour la durée du processus
+# (les échecs ne sont pas mémorisés pour pouvoir être retentés)
+_job_details_memo = {}
+
 def fetch_job_details(url):
     """
     Récupère les détails complets d'une offre d'emploi depuis sa page dédiée.
     
+    La page est lue depuis le cache disque si elle a moins de 24h, et les
+    récupérations réussies sont mémorisées pour la durée du processus.
+    
     Args:
         url (str): URL de l'offre d'emploi
         
     Returns:
         str: Contenu complet de la description de l'offre
     """
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-    }
+    details = _job_details_memo.get(url)
+    if details is not None:
+        return details
     
     try:
-        print(f"Récupération des détails de l'offre : {url}")
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code != 200:
-            print(f"Erreur lors de la récupération des détails: {response.status_code}")
-            return "Impossible de récupérer les détails de l'offre."
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Tenter de trouver la section de description de l'offre
-        description_selectors = [
-            "div.job-description", 
-            "div.description", 
-            "div[data-testid='job-description']",
-            "div[data-cy='jobDescription']",
-            "section.job-description",
-            "div.offer-description",
-            "div.tw-prose"  # Nouveau sélecteur pour HelloWork
-        ]
-        
-        for selector in description_selectors:
-            description_element = soup.select_one(selector)
-            if description_element:
-                return description_element.get_text(strip=True)
-        
-        # Si on ne trouve pas la description avec les sélecteurs spécifiques,
-        # essayons de récupérer tout le contenu principal
-        main_content = soup.select_one("main, article, div.main-content")
-        if main_content:
-            return main_content.get_text(strip=True)
-        
-        # Dernier recours: prendre tout ce qui ressemble à une description
-        all_paragraphs = soup.find_all('p')
-        if all_paragraphs and len(all_paragraphs) > 5:  # Au moins quelques paragraphes
-            content = "\n".join([p.get_text(strip=True) for p in all_paragraphs if len(p.get_text(strip=True)) > 50])
-            if content:
-                return content
+        content = _read_cached_page(url)
+        if content is None:
+            logger.debug("Récupération des détails de l'offre : %s", url)
+            status_code, content = fetch_page(url)
+            
+            if status_code != 200:
+                logger.error("Erreur lors de la récupération des détails: %s", status_code)
+                return "Impossible de récupérer les détails de l'offre."
+            
+            _write_cached_page(url, content)
         
-        return "Description non trouvée sur la page de l'offre."
+        details = extract_job_description(content)
         
     except Exception as e:
-        print(f"Erreur lors de la récupération des détails de l'offre: {str(e)}")
+        logger.error("Erreur lors de la récupération des détails de l'offre: %s", e)
         return f"Erreur: {str(e)}"
+    
+    _job_details_memo[url] = details
+    return details
+
+def read_text_file(path, label):
+    """
+    Lit un fichier texte, ou retourne une chaîne vide s'il n'existe pas.
+    
+    Args:
+        path (str): Chemin du fichier
+        label (str): Nom du fichier utilisé dans le message d'avertissement
+        
+    Returns:
+        str: Contenu du fichier
+    """
+    if not os.path.exists(path):
+        logger.warning("Attention: Le fichier %s %s n'existe pas.", label, path)
+        return ""
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
 
-def generate_cover_letter(job_data, cv_path="cv.txt", parcours_path="parcours.txt"):
+def generate_cover_letter(job_data, cv_text="", parcours_text="", today=None):
     """
     Génère une lettre de motivation personnalisée basée sur l'offre d'emploi et le CV.
     
     Args:
-        job_data (dict): Informations sur l'offre d'emploi
-        cv_path (str): Chemin vers le fichier CV
-        parcours_path (str): Chemin vers le fichier parcours
+        job_data (JobOffer): Informations sur l'offre d'emploi
+        cv_text (str): Extrait du CV à insérer dans la lettre
+        parcours_text (str): Extrait du parcours à insérer dans la lettre
+        today (str, optional): Date affichée dans la lettre. Par défaut la date du jour.
         
     Returns:
         str: Lettre de motivation générée
     """
     try:
-        # Récupérer le CV
-        cv_text = ""
-        if os.path.exists(cv_path):
-            with open(cv_path, 'r', encoding='utf-8') as file:
-                cv_text = file.read()
-        else:
-            print(f"Attention: Le fichier CV {cv_path} n'existe pas.")
-            
-        # Récupérer le parcours
-        parcours_text = ""
-        if os.path.exists(parcours_path):
-            with open(parcours_path, 'r', encoding='utf-8') as file:
-                parcours_text = file.read()
-        else:
-            print(f"Attention: Le fichier parcours {parcours_path} n'existe pas.")
-            
-        # Récupérer les détails complets de l'offre
-        job_description = fetch_job_details(job_data["link"])
-        
         # Date du jour
-        today = datetime.now().strftime("%d/%m/%Y")
+        if today is None:
+            today = datetime.now().strftime("%d/%m/%Y")
         
         # Créer un destinataire
-        destinataire = f"Service recrutement {job_data['company']}" if job_data['company'] != "Non spécifié" else "Service recrutement"
+        destinataire = f"Service recrutement {job_data.company}" if job_data.company != "Non spécifié" else "Service recrutement"
         
         # Créer un objet
-        objet = f"Candidature au poste de {job_data['title']}"
+        objet = f"Candidature au poste de {job_data.title}"
         
         # Générer la lettre
-        letter = f"""
-{today}
-
-{destinataire}
-{job_data['company']}
-
-Objet : {objet}
-
-Madame, Monsieur,
-
-Suite à votre offre d'emploi pour le poste de {job_data['title']} {f"à {job_data['location']}" if job_data['location'] != "Non spécifié" else ""}, je vous présente ma candidature avec enthousiasme.
-
-Mon profil correspond aux qualifications que vous recherchez comme le montre mon CV ci-joint.
-
-{cv_text[:200] if cv_text else ""}
-
-{parcours_text[:200] if parcours_text else ""}
-
-Particulièrement intéressé(e) par {job_data['company']}, je souhaite mettre à profit mon expertise pour contribuer à vos projets. Votre recherche de {job_data['title']} correspond parfaitement à mon parcours professionnel et à mes aspirations.
-
-Je serais ravi(e) de vous rencontrer pour vous présenter ma motivation et mes compétences lors d'un entretien.
-
-Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.
-
-[Votre nom]
-[Vos coordonnées]
-        """
+        letter = LETTER_TEMPLATE.substitute(
+            today=today,
+            destinataire=destinataire,
+            company=job_data.company,
+            objet=objet,
+            title=job_data.title,
+            location=f"à {job_data.location}" if job_data.location != "Non spécifié" else "",
+            cv_text=cv_text,
+            parcours_text=parcours_text,
+        )
             
         return letter
         
     except Exception as e:
-        print(f"Erreur lors de la génération de la lettre: {str(e)}")
+        logger.error("Erreur lors de la génération de la lettre: %s", e)
         return f"Erreur: Impossible de générer la lettre - {str(e)}"
 
-def save_cover_letter(job_data, letter_text):
+def save_cover_letter(job_data, letter_text, date_str=None):
     """
     Enregistre la lettre de motivation dans un fichier texte.
     
     Args:
-        job_data (dict): Informations sur l'offre d'emploi
+        job_data (JobOffer): Informations sur l'offre d'emploi
         letter_text (str): Contenu de la lettre de motivation
+        date_str (str, optional): Préfixe de date du fichier (AAAAMMJJ). Par défaut la date du jour.
         
     Returns:
         str: Chemin du fichier créé
@@ -366,14 +538,15 @@ def save_cover_letter(job_data, letter_text):
         os.makedirs(letters_dir)
     
     # Créer un nom de fichier à partir de l'entreprise et du titre du poste
-    company_name = re.sub(r'[^\w\s-]', '', job_data['company']).strip()
-    job_title = re.sub(r'[^\w\s-]', '', job_data['title']).strip()
+    company_name = UNSAFE_FILENAME_RE.sub('', job_data.company).strip()
+    job_title = UNSAFE_FILENAME_RE.sub('', job_data.title).strip()
     
     company_name = company_name.replace(' ', '_')
     job_title = job_title.replace(' ', '_')
     
     # Ajouter la date pour éviter les doublons
-    date_str = datetime.now().strftime("%Y%m%d")
+    if date_str is None:
+        date_str = datetime.now().strftime("%Y%m%d")
     
     filename = f"{date_str}_{company_name}_{job_title}.txt"
     filepath = os.path.join(letters_dir, filename)
@@ -382,42 +555,51 @@ def save_cover_letter(job_data, letter_text):
     try:
         with open(filepath, 'w', encoding='utf-8') as file:
             file.write(letter_text)
-        print(f"Lettre de motivation enregistrée dans {filepath}")
+        logger.debug("Lettre de motivation enregistrée dans %s", filepath)
         return filepath
     except Exception as e:
-        print(f"Erreur lors de l'enregistrement de la lettre: {str(e)}")
+        logger.error("Erreur lors de l'enregistrement de la lettre: %s", e)
         return None
 
-def generate_all_cover_letters(job_listings):
+def generate_all_cover_letters(job_listings, cv_path="cv.txt", parcours_path="parcours.txt"):
     """
     Génère des lettres de motivation pour toutes les offres d'emploi listées.
     
     Args:
-        job_listings (list): Liste des offres d'emploi
+        job_listings (list[JobOffer]): Liste des offres d'emploi
+        cv_path (str): Chemin vers le fichier CV
+        parcours_path (str): Chemin vers le fichier parcours
         
     Returns:
         int: Nombre de lettres générées avec succès
     """
     count = 0
     
-    print(f"\nGénération des lettres de motivation pour {len(job_listings)} offres...")
+    logger.info("Génération des lettres de motivation pour %d offres...", len(job_listings))
+    
+    # Le CV, le parcours et la date sont identiques pour toutes les lettres : les préparer une seule fois
+    cv_text = read_text_file(cv_path, "CV")[:200]
+    parcours_text = read_text_file(parcours_path, "parcours")[:200]
+    now = datetime.now()
+    today = now.strftime("%d/%m/%Y")
+    date_str = now.strftime("%Y%m%d")
     
     for job in job_listings:
         try:
             # Générer la lettre
-            letter = generate_cover_letter(job)
+            letter = generate_cover_letter(job, cv_text, parcours_text, today)
             
             # Enregistrer la lettre
-            filepath = save_cover_letter(job, letter)
+            filepath = save_cover_letter(job, letter, date_str)
             
             if filepath:
                 count += 1
-                print(f"Lettre générée pour: {job['title']} - {job['company']}")
+                logger.info("Lettre générée pour: %s - %s", job.title, job.company)
                 
         except Exception as e:
-            print(f"Erreur lors du traitement de l'offre {job['title']}: {str(e)}")
+            logger.error("Erreur lors du traitement de l'offre %s: %s", job.title, e)
     
-    print(f"\n{count} lettres de motivation ont été générées avec succès.")
+    logger.info("%d lettres de motivation ont été générées avec succès.", count)
     return count
 
 def main():
@@ -428,12 +610,18 @@ def main():
     parser.add_argument('--pages', type=int, default=1, help='Nombre de pages à scraper')
     parser.add_argument('--generate-letters', action='store_true', help='Générer des lettres de motivation pour chaque offre')
     parser.add_argument('--contrat', default='', help='Filtrer par type de contrat (ex: alternance, cdi, cdd, stage)')
+    parser.add_argument('--debug', action='store_true', help='Sauvegarder le HTML des pages de résultats pour analyse')
+    parser.add_argument('--verbose', action='store_true', help='Afficher la progression détaillée du scraping')
     
     args = parser.parse_args()
     
+    # Progression visible avec --verbose, détail par offre avec --debug
+    log_level = logging.DEBUG if args.debug else logging.INFO if args.verbose else logging.WARNING
+    logging.basicConfig(level=log_level, format="%(message)s")
+    
     try:
         # 1. Scraper les offres d'emploi
-        job_listings = scrape_job_listings(args.job, args.location, args.pages)
+        job_listings = scrape_job_listings(args.job, args.location, args.pages, args.debug)
         
         if not job_listings:
             print("Aucune offre d'emploi trouvée.")
@@ -441,22 +629,25 @@ def main():
             
         # Filtrer par type de contrat si spécifié
         if args.contrat:
-            contrat_lower = args.contrat.lower()
-            filtered_listings = []
-            print(f"\nFiltrage des offres pour le type de contrat '{args.contrat}'...")
+            contrat_re = re.compile(re.escape(args.contrat), re.IGNORECASE)
+            logger.info("Filtrage des offres pour le type de contrat '%s'...", args.contrat)
+            
+            # Vérifier si le type de contrat apparaît dans les informations de la carte
+            def matches_card(job):
+                return bool(contrat_re.search(f"{job.contract_type} {job.title} {job.description}"))
             
-            for job in job_listings:
-                # Vérifier si le type de contrat est dans la description
-                if 'description' in job and contrat_lower in job['description'].lower():
-                    filtered_listings.append(job)
-                # Si la description ne contient pas le type de contrat, récupérer les détails pour vérifier
-                else:
-                    # Récupérer les détails pour voir si le type de contrat est mentionné
-                    details = fetch_job_details(job['link'])
-                    if contrat_lower in details.lower():
-                        filtered_listings.append(job)
+            # Ne récupérer les détails (en parallèle) que si la carte n'indiquait pas le type de contrat
+            links_to_check = list(dict.fromkeys(
+                job.link for job in job_listings
+                if job.contract_type in UNKNOWN_CONTRACT_TYPES and not matches_card(job)
+            ))
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                details_by_link = dict(zip(links_to_check, executor.map(fetch_job_details, links_to_check)))
             
-            job_listings = filtered_listings
+            job_listings = [
+                job for job in job_listings
+                if matches_card(job) or (job.link in details_by_link and contrat_re.search(details_by_link[job.link]))
+            ]
             print(f"{len(job_listings)} offres correspondent au type de contrat '{args.contrat}'")
             
             if not job_listings:
@@ -466,8 +657,8 @@ def main():
         # Afficher un résumé des offres trouvées
         print("\nRésumé des offres trouvées:")
         for i, job in enumerate(job_listings, 1):
-            print(f"{i}. {job['title']} - {job['company']} - {job['location']}")
-            print(f"   {job['link']}")
+            print(f"{i}. {job.title} - {job.company} - {job.location}")
+            print(f"   {job.link}")
         
         # 2. Générer des lettres de motivation si demandé
         if args.generate_letters:
@@ -11,15 +11,40 @@ import os
 import sys
 import time
 import json
+import csv
 import random
+import string
+import unicodedata
+import hashlib
+import functools
+import itertools
+import operator
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # Automate d'Aho-Corasick : toutes les compétences en une passe sur le texte
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+try:
+    # orjson (en C) sérialise les sauvegardes bien plus vite ; le module json reste utilisé s'il est absent
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # curl_cffi reproduit l'empreinte TLS/HTTP2 de Chrome ; requests reste utilisé s'il est absent
+    from curl_cffi import requests as curl_requests
+except ImportError:
+    curl_requests = None
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
 import re
 import argparse
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-import pandas as pd
+# gspread, oauth2client, pandas et pyarrow sont importés à la demande (Google Sheets, export CSV)
 import textwrap
 import colorama
 from colorama import Fore, Back, Style
@@ -40,6 +65,270 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5.1 Safari/605.1.15",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
 ]
+REQUEST_TIMEOUT = 10
+# Nombre maximum de requêtes simultanées vers HelloWork
+MAX_WORKERS = 10
+# Cache disque du texte des offres (un fichier par URL)
+DETAILS_CACHE_DIR = os.path.join(".cache", "offer_details")
+CACHE_TTL = 24 * 3600
+# Étendue (scope) d'accès à l'API Google Sheets
+SHEETS_SCOPE = ['https://spreadsheets.google.com/feeds',
+                'https://www.googleapis.com/auth/drive']
+# Nombre maximal de lignes envoyées par requête à l'API Google Sheets
+SHEETS_BATCH_ROWS = 500
+# Champs d'une offre exportés dans Google Sheets, lus en un appel (attrgetter est en C)
+SHEET_JOB_FIELDS = operator.attrgetter("title", "company", "location", "contract_type", "description", "link")
+# En-têtes de la feuille Google Sheets (mis en gras à la création)
+SHEET_HEADERS = ["Date", "Titre", "Entreprise", "Localisation", "Type de contrat", "Description", "Lien vers l'offre", "Lien vers la lettre de motivation"]
+
+# Compétences techniques recherchées dans les offres et le CV
+TECH_SKILLS = [
+    "Python", "SQL", "Java", "JavaScript", "TypeScript", "C#", "C++", "PHP", "Ruby",
+    "Angular", "React", "Vue", "Node.js", "Django", "Flask", "Spring", "Laravel", "Ruby on Rails",
+    "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "Terraform",
+    "MySQL", "PostgreSQL", "Oracle", "MongoDB", "Cassandra", "Redis",
+    "Hadoop", "Spark", "Kafka", "Airflow", "Databricks", "dbt",
+    "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "Data Mining",
+    "Agile", "Scrum", "DevOps", "CI/CD", "Jenkins", "Git"
+]
+# Une seule expression pour toutes les compétences : à chaque début de mot, une assertion
+# optionnelle par compétence (groupe skill<i>), pour retrouver aussi les compétences qui se
+# chevauchent (ex: "Ruby" et "Ruby on Rails"), comme l'automate
+SKILLS_RE = re.compile(
+    r'(?<!\w)(?=\w)' + ''.join(
+        rf'(?:(?=(?P<skill{i}>{re.escape(skill)})(?!\w)))?' for i, skill in enumerate(TECH_SKILLS)
+    ),
+    re.IGNORECASE
+)
+SKILLS_AUTOMATON = None
+if ahocorasick is not None:
+    SKILLS_AUTOMATON = ahocorasick.Automaton()
+    for _skill in TECH_SKILLS:
+        SKILLS_AUTOMATON.add_word(_skill.lower(), _skill)
+    SKILLS_AUTOMATON.make_automaton()
+
+# Mots-clés signalant une offre en alternance
+ALTERNANCE_KEYWORDS = frozenset(("altern", "apprentissage"))
+
+# Types de contrat et mots-clés associés, par ordre de priorité
+CONTRACT_TYPES = {
+    "CDI": ["cdi", "contrat à durée indéterminée", "permanent", "indéterminée"],
+    "CDD": ["cdd", "contrat à durée déterminée", "déterminée", "temporaire"],
+    "Alternance": ["altern", "apprentissage", "apprenti", "contrat pro", "professionnalisation"],
+    "Stage": ["stage", "stagiaire", "internship", "intern"],
+    "Freelance": ["freelance", "indépendant", "consultant externe", "auto-entrepreneur"],
+    "Intérim": ["intérim", "mission temporaire", "mission d'intérim"],
+    "Temps partiel": ["temps partiel", "mi-temps", "part-time"],
+    "Temps plein": ["temps plein", "temps complet", "full-time"]
+}
+
+# Expressions régulières compilées une seule fois
+# Un groupe nommé par type de contrat ; le lookahead permet de détecter aussi les mots-clés
+# qui se chevauchent (ex. "déterminée" dans "indéterminée"), comme des recherches séparées
+CONTRACT_GROUPS = {f"contract{i}": contract_type for i, contract_type in enumerate(CONTRACT_TYPES)}
+CONTRACT_RE = re.compile("(?=" + "|".join(
+    f"(?P<{group}>{'|'.join(map(re.escape, CONTRACT_TYPES[contract_type]))})"
+    for group, contract_type in CONTRACT_GROUPS.items()
+) + ")")
+COMPANY_RE = re.compile(r'chez\s+(\w+)')
+LOCATION_RE = re.compile(r'à\s+([^,]+)')
+
+# Nettoyage des noms de fichiers en une passe : ponctuation ASCII supprimée (sauf - et _), blancs remplacés par _
+FILENAME_TABLE = str.maketrans({
+    **dict.fromkeys(string.punctuation.replace("-", "").replace("_", "")),
+    **dict.fromkeys(string.whitespace, "_"),
+})
+
+# Classes des blocs pouvant contenir la description d'une offre
+DESCRIPTION_CLASSES = {"job-description", "description", "offer-description", "tw-prose", "main-content"}
+
+def _is_listing_tag(name, attrs):
+    """Garde uniquement les cartes d'offres et les liens vers des offres lors de l'analyse."""
+    return ((name == "div" and attrs.get("data-cy") == "serpCard")
+            or (name == "a" and "/emplois/" in (attrs.get("href") or "")))
+
+def _is_description_tag(name, attrs):
+    """Garde uniquement les blocs susceptibles de contenir la description d'une offre."""
+    if name in ("main", "article", "p"):
+        return True
+    if name not in ("div", "section"):
+        return False
+    return (attrs.get("data-testid") == "job-description"
+            or attrs.get("data-cy") == "jobDescription"
+            or not DESCRIPTION_CLASSES.isdisjoint((attrs.get("class") or "").split()))
+
+# Filtres appliqués pendant l'analyse : le reste de la page n'est jamais construit
+LISTING_STRAINER = SoupStrainer(_is_listing_tag)
+DESCRIPTION_STRAINER = SoupStrainer(_is_description_tag)
+
+class JobCardExtractor:
+    """
+    Cible lxml qui extrait les champs utiles des cartes d'offres (div[data-cy="serpCard"])
+    au fil de l'analyse, sans construire d'arbre.
+    """
+    
+    # Champs de la carte : premier élément correspondant, dans l'ordre du document
+    FIELDS = ("link", "first_link", "title", "fallback_title", "company", "location", "contract", "date")
+    
+    def __init__(self):
+        self.cards = []
+        self._card = None
+        self._stack = []  # (balise, champs collectés par cet élément, dans un h3, morceaux de texte)
+        self._text = []
+    
+    def _field_names(self, tag, attrs, in_h3):
+        """Retourne les champs encore libres pour lesquels cet élément correspond."""
+        classes = (attrs.get("class") or "").split()
+        data_cy = attrs.get("data-cy")
+        names = []
+        if tag == "p":
+            if "tw-typo-l" in classes or "tw-typo-xl" in classes or in_h3:
+                names.append("title")
+            if "tw-inline" in classes or "tw-typo-s" in classes:
+                names.append("company")
+        elif tag in ("h3", "h2"):
+            names.append("fallback_title")
+        elif tag == "div":
+            if data_cy == "localisationCard":
+                names.append("location")
+            elif data_cy == "contractCard":
+                names.append("contract")
+            if "tw-typo-s" in classes and "tw-text-grey" in classes:
+                names.append("date")
+        return [name for name in names if name not in self._card]
+    
+    def _flush_text(self):
+        """Ajoute le texte accumulé (nettoyé) aux éléments en cours de collecte."""
+        if not self._text:
+            return
+        text = "".join(self._text).strip()
+        self._text = []
+        if text:
+            for _, names, _, pieces in self._stack:
+                if names:
+                    pieces.append(text)
+    
+    def start(self, tag, attrs):
+        """Ouverture d'un élément."""
+        self._flush_text()
+        if self._card is None:
+            if tag == "div" and attrs.get("data-cy") == "serpCard":
+                self._card = {}
+                self._stack = [(tag, (), False, [])]
+            return
+        
+        in_h3 = self._stack[-1][2] or tag == "h3"
+        if tag == "a":
+            href = attrs.get("href")
+            if "first_link" not in self._card:
+                self._card["first_link"] = href
+            if "link" not in self._card and href and "/emplois/" in href:
+                self._card["link"] = href
+        names = self._field_names(tag, attrs, self._stack[-1][2])
+        for name in names:
+            self._card[name] = None  # Réservé : le texte est renseigné à la fermeture
+        self._stack.append((tag, names, in_h3, []))
+    
+    def end(self, tag):
+        """Fermeture d'un élément."""
+        self._flush_text()
+        if self._card is None:
+            return
+        _, names, _, pieces = self._stack.pop()
+        for name in names:
+            self._card[name] = "".join(pieces)
+        if not self._stack:
+            self.cards.append(self._card)
+            self._card = None
+    
+    def data(self, text):
+        """Texte entre deux balises."""
+        if self._card is not None:
+            self._text.append(text)
+    
+    def close(self):
+        """Fin du document : retourne les cartes extraites."""
+        return self.cards
+
+def extract_job_cards(content):
+    """
+    Extrait les cartes d'offres d'une page de résultats en une seule passe lxml.
+    
+    Args:
+        content (bytes): Contenu HTML brut de la page (l'encodage est détecté par lxml)
+        
+    Returns:
+        list: Un dictionnaire par carte (champs de JobCardExtractor.FIELDS trouvés)
+    """
+    parser = etree.HTMLParser(target=JobCardExtractor())
+    parser.feed(content)
+    return parser.close()
+
+def create_session(proxy=None):
+    """
+    Crée une session HTTP avec pool de connexions (keep-alive) vers HelloWork.
+    Utilise curl_cffi (imitation de Chrome, HTTP/2) s'il est installé, sinon requests.
+    
+    Args:
+        proxy (str, optional): Proxy à utiliser pour toutes les requêtes de la session
+        
+    Returns:
+        requests.Session: La session configurée
+    """
+    if curl_requests is not None:
+        session = curl_requests.Session(impersonate="chrome")
+        session.headers.update({"Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7"})
+    else:
+        session = requests.Session()
+        session.headers.update({
+            "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        })
+        session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            # 429 et 503 sont laissés à get_with_backoff, qui plafonne l'attente Retry-After
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504], raise_on_status=False)
+        ))
+    if proxy:
+        session.proxies = {"http": proxy, "https": proxy}
+    return session
+
+@dataclass(slots=True)
+class JobListing:
+    """Offre d'emploi extraite d'une page de résultats HelloWork."""
+    title: str
+    company: str
+    location: str
+    description: str
+    link: str
+    contract_type: str
+    is_alternance: bool
+    job_details_text: str | None = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit une offre à partir d'un dictionnaire (sauvegarde JSON), en ignorant les clés inconnues."""
+        return cls(**{field.name: data[field.name] for field in fields(cls) if field.name in data})
+
+# Erreurs réseau (connexion, délai dépassé) du client HTTP utilisé
+NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout)
+if curl_requests is not None:
+    NETWORK_ERRORS += (curl_requests.exceptions.ConnectionError, curl_requests.exceptions.Timeout)
+
+# Session HTTP partagée pour les requêtes sans proxy
+SESSION = create_session()
+
+# Attente en cas de limitation de débit (429/503) : Retry-After par défaut et plafond, en secondes
+RATE_LIMIT_STATUSES = (429, 503)
+DEFAULT_RETRY_AFTER = 5
+MAX_RETRY_AFTER = 60
+
+# Rotation des proxies : une session par proxy, et les proxies en échec sont écartés un moment
+PROXY_RETRY_DELAY = 300
+_proxy_turn = itertools.count()
+_proxy_sessions = {}
+_dead_proxies = {}
 
 def print_header():
     """Affiche un en-tête stylisé pour le programme"""
@@ -69,8 +358,20 @@ def print_info(message):
     """Affiche un message d'information"""
     print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
 
+# Intervalle minimal (secondes) entre deux rafraîchissements de la barre de progression
+PROGRESS_INTERVAL = 0.1
+# Heure du dernier affichage de chaque barre de progression, indexée par sa description
+_last_progress_print = {}
+
 def print_progress(current, total, description="Progression"):
-    """Affiche une barre de progression"""
+    """Affiche une barre de progression, rafraîchie au plus toutes les PROGRESS_INTERVAL secondes"""
+    now = time.monotonic()
+    # Toujours afficher le premier et le dernier état ; ignorer les mises à jour trop rapprochées
+    # d'une même barre (les autres barres ont leur propre horodatage)
+    if current > 1 and current != total and now - _last_progress_print.get(description, 0.0) < PROGRESS_INTERVAL:
+        return
+    _last_progress_print[description] = now
+    
     bar_length = 50
     filled_length = int(bar_length * current / total)
     bar = '█' * filled_length + '░' * (bar_length - filled_length)
@@ -83,6 +384,39 @@ def get_random_user_agent():
     """Retourne un User-Agent aléatoire"""
     return random.choice(USER_AGENTS)
 
+def get_request_headers():
+    """
+    Retourne les en-têtes propres à une requête
+    
+    Avec curl_cffi, le User-Agent du navigateur imité est conservé pour rester cohérent
+    avec son empreinte TLS ; sinon un User-Agent aléatoire est choisi.
+    """
+    if curl_requests is not None:
+        return {}
+    return {"User-Agent": get_random_user_agent()}
+
+@functools.lru_cache(maxsize=1)
+def read_proxy_file(proxy_file, mtime):
+    """
+    Lit et analyse le fichier de proxies, mémorisé tant que sa date de modification ne change pas
+    
+    Args:
+        proxy_file (str): Chemin vers le fichier de proxies
+        mtime (float): Date de modification du fichier (clé du cache)
+        
+    Returns:
+        tuple: Proxies lus dans le fichier
+    """
+    proxies = []
+    with open(proxy_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            # Ignorer les lignes vides ou commentaires
+            if line and not line.startswith('#') and ':' in line:
+                # Formater correctement le proxy
+                proxies.append(f"http://{line}")
+    return tuple(proxies)
+
 def load_proxies(proxy_file="proxies.txt"):
     """
     Charge une liste de proxies depuis un fichier texte.
@@ -97,13 +431,7 @@ def load_proxies(proxy_file="proxies.txt"):
     proxies = []
     try:
         if os.path.exists(proxy_file):
-            with open(proxy_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Ignorer les lignes vides ou commentaires
-                    if line and not line.startswith('#') and ':' in line:
-                        # Formater correctement le proxy
-                        proxies.append(f"http://{line}")
+            proxies = list(read_proxy_file(proxy_file, os.path.getmtime(proxy_file)))
             print_info(f"{len(proxies)} proxies chargés depuis {proxy_file}")
         else:
             print_warning(f"Fichier de proxies {proxy_file} non trouvé")
@@ -111,6 +439,33 @@ def load_proxies(proxy_file="proxies.txt"):
         print_error(f"Erreur lors du chargement des proxies: {str(e)}")
     return proxies
 
+def get_with_backoff(session, url, headers):
+    """
+    Effectue une requête GET et, si le serveur limite le débit (429/503), attend le délai
+    demandé par l'en-tête Retry-After avant de réessayer une fois
+    
+    Args:
+        session: La session HTTP à utiliser
+        url (str): L'URL à requêter
+        headers (dict): Les en-têtes HTTP à utiliser
+        
+    Returns:
+        response: La réponse HTTP
+    """
+    response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code not in RATE_LIMIT_STATUSES:
+        return response
+    
+    try:
+        delay = int(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except ValueError:
+        # Retry-After peut aussi être une date HTTP
+        delay = DEFAULT_RETRY_AFTER
+    delay = min(max(delay, 0), MAX_RETRY_AFTER)
+    print_warning(f"Limitation de débit (HTTP {response.status_code}), nouvelle tentative dans {delay}s...")
+    time.sleep(delay)
+    return session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
 def get_request_with_proxy(url, headers, proxies=None):
     """
     Effectue une requête HTTP GET avec gestion des proxies et des erreurs
@@ -126,30 +481,53 @@ def get_request_with_proxy(url, headers, proxies=None):
     if not proxies:
         # Sans proxy
         try:
-            return requests.get(url, headers=headers, timeout=10)
+            return get_with_backoff(SESSION, url, headers)
         except Exception as e:
             print_error(f"Erreur lors de la requête: {str(e)}")
             return None
     
-    # Avec proxies, essayer chaque proxy jusqu'à ce qu'un fonctionne
-    for proxy in proxies:
+    # Avec proxies, partir du proxy suivant dans la rotation et ignorer ceux récemment en échec
+    start = next(_proxy_turn) % len(proxies)
+    now = time.time()
+    live_proxies = [proxy for proxy in proxies[start:] + proxies[:start]
+                    if now - _dead_proxies.get(proxy, 0) >= PROXY_RETRY_DELAY]
+    
+    for proxy in live_proxies:
         try:
-            proxy_dict = {"http": proxy, "https": proxy}
-            response = requests.get(url, headers=headers, proxies=proxy_dict, timeout=10)
+            if proxy not in _proxy_sessions:
+                _proxy_sessions[proxy] = create_session(proxy)
+            response = get_with_backoff(_proxy_sessions[proxy], url, headers)
             if response.status_code == 200:
                 print_info(f"Requête réussie avec proxy: {proxy}")
                 return response
+        except NETWORK_ERRORS:
+            _dead_proxies[proxy] = time.time()
         except Exception as e:
             continue
     
     # Si tous les proxies ont échoué, essayer sans proxy
     try:
         print_warning("Tous les proxies ont échoué, tentative sans proxy...")
-        return requests.get(url, headers=headers, timeout=10)
+        return get_with_backoff(SESSION, url, headers)
     except Exception as e:
         print_error(f"Erreur lors de la requête sans proxy: {str(e)}")
         return None
 
+def get_page_with_jitter(url, headers, proxies=None):
+    """
+    Effectue une requête après un court délai aléatoire, pour étaler les requêtes parallèles
+    
+    Args:
+        url (str): L'URL à requêter
+        headers (dict): Les en-têtes HTTP à utiliser
+        proxies (list): Liste de proxies disponibles
+        
+    Returns:
+        response: La réponse HTTP ou None en cas d'erreur
+    """
+    time.sleep(random.uniform(0.2, 1.0))
+    return get_request_with_proxy(url, headers, proxies)
+
 def get_user_input(prompt, default=None):
     """
     Récupère une entrée utilisateur avec une valeur par défaut
@@ -194,7 +572,7 @@ def get_yes_no(prompt, default="oui"):
         
         print_warning("Veuillez répondre par 'o' ou 'n'.")
 
-def scrape_job_listings(job_title, location="", max_pages=1, contract_type="", proxies=None):
+def scrape_job_listings(job_title, location="", max_pages=1, contract_type="", proxies=None, debug=False):
     """
     Scrape les offres d'emploi depuis HelloWork.
     
@@ -203,13 +581,15 @@ def scrape_job_listings(job_title, location="", max_pages=1, contract_type="", p
         location (str, optional): La localisation. Par défaut "".
         max_pages (int, optional): Nombre maximum de pages à scraper. Par défaut 1.
         contract_type (str, optional): Type de contrat à filtrer. Par défaut "".
-        proxies (list, optional): Liste de proxies à utiliser. Par défaut None.
+        proxies (list, optional): Liste de proxies à utiliser. Par défaut None (lecture de proxies.txt).
+        debug (bool, optional): Sauvegarder le HTML de chaque page dans debug/. Par défaut False.
     
     Returns:
-        list: Liste des offres d'emploi
+        list: Liste des offres d'emploi (JobListing)
     """
     job_listings = []
     seen_links = set()  # Ensemble pour suivre les liens déjà vus
+    contract_type_lower = contract_type.lower()
     
     # Préparer les paramètres de l'URL
     job_param = job_title.replace(" ", "+")
@@ -218,202 +598,193 @@ def scrape_job_listings(job_title, location="", max_pages=1, contract_type="", p
     # Construire l'URL de recherche
     search_url = SEARCH_URL_PATTERN.format(job=job_param, location=location_param)
     
-    headers = {
-        "User-Agent": get_random_user_agent(),
-        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-    }
+    headers = get_request_headers()
     
     print_info(f"Recherche d'offres pour: {job_title}")
     print_info(f"URL de recherche: {search_url}")
     
-    # Charger les proxies depuis un fichier
-    proxies = load_proxies("proxies.txt")
+    # Charger les proxies depuis un fichier s'ils n'ont pas été fournis
+    if proxies is None:
+        proxies = load_proxies("proxies.txt")
     
-    for page in range(1, max_pages + 1):
-        try:
-            # Ajout du paramètre de pagination si nécessaire
-            if page > 1:
-                page_url = f"{search_url}&page={page}"
-            else:
-                page_url = search_url
-            
-            print_info(f"Scraping de la page {page}/{max_pages}...")
-            response = get_request_with_proxy(page_url, headers, proxies)
-            
-            if response is None or response.status_code != 200:
-                print_error(f"Erreur lors de la requête: {response.status_code if response else 'Aucune réponse'}")
-                break
-            
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # Sauvegarder la page pour analyse (en mode debug)
-            debug_dir = 'debug'
-            if not os.path.exists(debug_dir):
-                os.makedirs(debug_dir)
+    # Ajout du paramètre de pagination si nécessaire
+    page_urls = [search_url if page == 1 else f"{search_url}&page={page}" for page in range(1, max_pages + 1)]
+    
+    # Télécharger toutes les pages en parallèle ; chaque page est analysée dès qu'elle est
+    # arrivée, pendant que les suivantes continuent de se télécharger
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        page_futures = [executor.submit(get_page_with_jitter, page_url, headers, proxies) for page_url in page_urls]
+        
+        for page, page_future in enumerate(page_futures, 1):
+            try:
+                print_info(f"Scraping de la page {page}/{max_pages}...")
+                response = page_future.result()
                 
-            with open(os.path.join(debug_dir, f"debug_page_{page}.html"), "w", encoding="utf-8") as f:
-                f.write(response.text)
-            
-            # 1. Chercher des éléments qui pourraient contenir des offres d'emploi par data-cy="serpCard"
-            job_cards = soup.select('div[data-cy="serpCard"]')
-            
-            # 2. Si aucune offre trouvée, chercher des liens d'offres
-            if not job_cards:
-                print_warning("Pas d'offres trouvées avec les sélecteurs standards, essai avec les liens...")
-                job_links = soup.find_all('a', href=lambda href: href and '/emplois/' in href)
+                if response is None or response.status_code != 200:
+                    print_error(f"Erreur lors de la requête: {response.status_code if response else 'Aucune réponse'}")
+                    # Inutile de télécharger les pages suivantes : annuler celles qui n'ont pas démarré
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
                 
-                # Filtrer pour ne garder que les liens qui semblent être des offres
-                job_links = [link for link in job_links if not any(exclude in link.get('href', '') for exclude in ['recherche', 'page='])]
+                # Sauvegarder la page pour analyse (en mode debug)
+                if debug:
+                    os.makedirs('debug', exist_ok=True)
+                    with open(os.path.join('debug', f"debug_page_{page}.html"), "wb") as f:
+                        f.write(response.content)
                 
-                if job_links:
-                    print_info(f"Trouvé {len(job_links)} liens directs vers des offres")
+                # 1. Chercher des éléments qui pourraient contenir des offres d'emploi par data-cy="serpCard"
+                job_cards = extract_job_cards(response.content)
                 
-                for link in job_links:
-                    href = link.get('href')
-                    title = link.get_text(strip=True)
+                # 2. Si aucune offre trouvée, chercher des liens d'offres
+                if not job_cards:
+                    print_warning("Pas d'offres trouvées avec les sélecteurs standards, essai avec les liens...")
+                    soup = BeautifulSoup(response.content, "lxml", parse_only=LISTING_STRAINER)
+                    job_links = soup.find_all('a', href=lambda href: href and '/emplois/' in href)
                     
-                    if not title:
-                        title_elem = link.find(['h2', 'h3', 'p'])
-                        if title_elem:
-                            title = title_elem.get_text(strip=True)
-                        else:
-                            title = "Titre non disponible"
-                      # Construire l'URL complète
-                    full_url = href if href.startswith(('http://', 'https://')) else BASE_URL + href
+                    # Filtrer pour ne garder que les liens qui semblent être des offres
+                    job_links = [link for link in job_links if not any(exclude in link.get('href', '') for exclude in ['recherche', 'page='])]
                     
-                    # Vérifier si ce lien a déjà été traité
-                    if full_url in seen_links:
-                        continue
-                    seen_links.add(full_url)
+                    if job_links:
+                        print_info(f"Trouvé {len(job_links)} liens directs vers des offres")
                     
-                    # Extraire l'entreprise et la localisation de l'attribut title/aria-label
-                    company = "Non spécifié"
-                    job_location = location or "Non spécifié"
-                    
-                    aria_label = link.get('aria-label')
-                    if aria_label:
-                        company_match = re.search(r'chez\s+(\w+)', aria_label)
-                        if company_match:
-                            company = company_match.group(1)
+                    for link in job_links:
+                        href = link.get('href')
+                        # La plupart des liens n'ont qu'un nœud texte : éviter le parcours récursif de get_text
+                        title = (link.string or link.get_text(strip=True) or "").strip()
                         
-                        location_match = re.search(r'à\s+([^,]+)', aria_label)
-                        if location_match:
-                            job_location = location_match.group(1)
-                    
-                    # Vérifier si c'est potentiellement une alternance basé sur le titre
-                    is_alternance = False
-                    detected_contract_type = "À déterminer"
-                    if 'altern' in title.lower() or 'apprentissage' in title.lower():
-                        is_alternance = True
-                        detected_contract_type = "Potentiellement alternance/apprentissage"
-                    
-                    # Vérifier si cela correspond au type de contrat recherché
-                    if contract_type and (contract_type.lower() not in title.lower() and contract_type.lower() not in detected_contract_type.lower()):
-                        continue  # Ignorer cette offre si elle ne correspond pas au type de contrat recherché
-                    
-                    job_listings.append({
-                        "title": title,
-                        "company": company,
-                        "location": job_location,
-                        "description": f"Type de contrat: {detected_contract_type}",
-                        "link": full_url,
-                        "contract_type": detected_contract_type,
-                        "is_alternance": is_alternance
-                    })
-            
-            # 3. Si des offres ont été trouvées avec les sélecteurs standards
-            else:
-                print_info(f"Nombre d'offres trouvées sur la page {page}: {len(job_cards)}")
-                
-                # Afficher une barre de progression
-                progress_count = 0
-                total_jobs = len(job_cards)
-                
-                for job in job_cards:
-                    progress_count += 1
-                    print_progress(progress_count, total_jobs, "Analyse des offres")
-                    
-                    try:                        # Trouver le lien principal de l'offre
-                        link_element = job.select_one('a[href*="/emplois/"]')
-                        if not link_element:
-                            link_element = job.find('a')
-                            if not link_element or not link_element.get('href'):
-                                continue
+                        if not title:
+                            title_elem = link.find(['h2', 'h3', 'p'])
+                            if title_elem:
+                                title = title_elem.get_text(strip=True)
+                            else:
+                                title = "Titre non disponible"
+                          # Construire l'URL complète
+                        full_url = href if href.startswith(('http://', 'https://')) else BASE_URL + href
                         
-                        link = link_element.get('href')
-                        
-                        # S'assurer que le lien est absolu
-                        if not link.startswith(('http://', 'https://')):
-                            link = BASE_URL + link
-                            
                         # Vérifier si ce lien a déjà été traité
-                        if link in seen_links:
+                        if full_url in seen_links:
                             continue
-                        seen_links.add(link)
-                        
-                        # Trouver le titre de l'offre
-                        title_element = job.select_one('p.tw-typo-l, p.tw-typo-xl, h3 p')
-                        
-                        if not title_element:
-                            title_element = job.find(['h3', 'h2', 'p.tw-typo-l'])
-                            if not title_element:
-                                continue
+                        seen_links.add(full_url)
                         
-                        title = title_element.get_text(strip=True)
+                        # Extraire l'entreprise et la localisation de l'attribut title/aria-label
+                        company = "Non spécifié"
+                        job_location = location or "Non spécifié"
                         
-                        # Trouver le nom de l'entreprise
-                        company_element = job.select_one('p.tw-inline, p.tw-typo-s')
-                        company = company_element.get_text(strip=True) if company_element else "Non spécifié"
-                        
-                        # Trouver la localisation
-                        location_element = job.select_one('div[data-cy="localisationCard"]')
-                        job_location = location_element.get_text(strip=True) if location_element else location or "Non spécifié"
-                        
-                        # Trouver des informations supplémentaires comme le type de contrat
-                        contract_element = job.select_one('div[data-cy="contractCard"]')
-                        detected_contract_type = contract_element.get_text(strip=True) if contract_element else "Non spécifié"
-                        
-                        # Chercher une description ou extrait
-                        description = f"Type de contrat: {detected_contract_type}"
+                        aria_label = link.get('aria-label')
+                        if aria_label:
+                            company_match = COMPANY_RE.search(aria_label)
+                            if company_match:
+                                company = company_match.group(1)
+                            
+                            location_match = LOCATION_RE.search(aria_label)
+                            if location_match:
+                                job_location = location_match.group(1)
                         
-                        # Vérifier si c'est une alternance (peut être dans le titre ou type de contrat)
-                        is_alternance = False
-                        if 'altern' in detected_contract_type.lower() or 'apprentissage' in detected_contract_type.lower():
-                            is_alternance = True
-                            description += " (Alternance)"
-                        elif 'altern' in title.lower() or 'apprentissage' in title.lower():
-                            is_alternance = True
-                            description += " (Alternance mentionnée dans le titre)"
+                        # Vérifier si c'est potentiellement une alternance basé sur le titre
+                        title_lower = title.lower()
+                        is_alternance = any(keyword in title_lower for keyword in ALTERNANCE_KEYWORDS)
+                        detected_contract_type = "Potentiellement alternance/apprentissage" if is_alternance else "À déterminer"
                         
                         # Vérifier si cela correspond au type de contrat recherché
-                        if contract_type and not (contract_type.lower() in detected_contract_type.lower() or 
-                                                ('alternance' in contract_type.lower() and is_alternance)):
+                        if contract_type and (contract_type_lower not in title_lower and contract_type_lower not in detected_contract_type.lower()):
                             continue  # Ignorer cette offre si elle ne correspond pas au type de contrat recherché
                         
-                        # Ajouter la date de publication si disponible
-                        date_element = job.select_one('div.tw-typo-s.tw-text-grey')
-                        if date_element:
-                            description += f" | Publié: {date_element.get_text(strip=True)}"
-                        
-                        job_listings.append({
-                            "title": title,
-                            "company": company,
-                            "location": job_location,
-                            "description": description,
-                            "link": link,
-                            "contract_type": detected_contract_type,
-                            "is_alternance": is_alternance
-                        })
+                        job_listings.append(JobListing(
+                            title=title,
+                            company=company,
+                            location=job_location,
+                            description=f"Type de contrat: {detected_contract_type}",
+                            link=full_url,
+                            contract_type=detected_contract_type,
+                            is_alternance=is_alternance
+                        ))
+                
+                # 3. Si des offres ont été trouvées avec les sélecteurs standards
+                else:
+                    print_info(f"Nombre d'offres trouvées sur la page {page}: {len(job_cards)}")
+                    
+                    # Afficher une barre de progression
+                    progress_count = 0
+                    total_jobs = len(job_cards)
+                    
+                    for job in job_cards:
+                        progress_count += 1
+                        print_progress(progress_count, total_jobs, "Analyse des offres")
                         
-                    except Exception as e:
-                        print_error(f"Erreur lors de l'extraction d'une offre: {str(e)}")
-            
-            # Pause pour éviter de surcharger le serveur
-            time.sleep(2)
-            
-        except Exception as e:
-            print_error(f"Erreur lors du scraping de la page {page}: {str(e)}")
+                        try:                        # Trouver le lien principal de l'offre
+                            link = job.get('link') or job.get('first_link')
+                            if not link:
+                                continue
+                            
+                            # S'assurer que le lien est absolu
+                            if not link.startswith(('http://', 'https://')):
+                                link = BASE_URL + link
+                                
+                            # Vérifier si ce lien a déjà été traité
+                            if link in seen_links:
+                                continue
+                            seen_links.add(link)
+                            
+                            # Trouver le titre de l'offre
+                            title = job.get('title')
+                            if title is None:
+                                title = job.get('fallback_title')
+                                if title is None:
+                                    continue
+                            
+                            # Trouver le nom de l'entreprise
+                            company = job.get('company')
+                            if company is None:
+                                company = "Non spécifié"
+                            
+                            # Trouver la localisation
+                            job_location = job.get('location')
+                            if job_location is None:
+                                job_location = location or "Non spécifié"
+                            
+                            # Trouver des informations supplémentaires comme le type de contrat
+                            detected_contract_type = job.get('contract')
+                            if detected_contract_type is None:
+                                detected_contract_type = "Non spécifié"
+                            
+                            # Chercher une description ou extrait
+                            description = f"Type de contrat: {detected_contract_type}"
+                            
+                            # Vérifier si c'est une alternance (peut être dans le titre ou type de contrat)
+                            contract_lower = detected_contract_type.lower()
+                            title_lower = title.lower()
+                            is_alternance = False
+                            if any(keyword in contract_lower for keyword in ALTERNANCE_KEYWORDS):
+                                is_alternance = True
+                                description += " (Alternance)"
+                            elif any(keyword in title_lower for keyword in ALTERNANCE_KEYWORDS):
+                                is_alternance = True
+                                description += " (Alternance mentionnée dans le titre)"
+                            
+                            # Vérifier si cela correspond au type de contrat recherché
+                            if contract_type and not (contract_type_lower in contract_lower or 
+                                                    ('alternance' in contract_type_lower and is_alternance)):
+                                continue  # Ignorer cette offre si elle ne correspond pas au type de contrat recherché
+                            
+                            # Ajouter la date de publication si disponible
+                            if job.get('date') is not None:
+                                description += f" | Publié: {job['date']}"
+                            
+                            job_listings.append(JobListing(
+                                title=title,
+                                company=company,
+                                location=job_location,
+                                description=description,
+                                link=link,
+                                contract_type=detected_contract_type,
+                                is_alternance=is_alternance
+                            ))
+                            
+                        except Exception as e:
+                            print_error(f"Erreur lors de l'extraction d'une offre: {str(e)}")
+                
+            except Exception as e:
+                print_error(f"Erreur lors du scraping de la page {page}: {str(e)}")
     
     print_success(f"Nombre total d'offres trouvées: {len(job_listings)}")
     
@@ -422,89 +793,148 @@ def scrape_job_listings(job_title, location="", max_pages=1, contract_type="", p
         print_section("Filtrage des offres par type de contrat")
         print_info(f"Recherche approfondie des offres de type '{contract_type}'...")
         
-        filtered_listings = []
-        progres_count = 0
+        # Si le type de contrat apparaît déjà dans la carte (contrat, titre ou description),
+        # l'offre est gardée directement sans récupérer ses détails
+        def matches_listing(job):
+            return (contract_type_lower == 'alternance' and job.is_alternance) or \
+                   contract_type_lower in job.contract_type.lower() or \
+                   contract_type_lower in job.title.lower() or \
+                   contract_type_lower in job.description.lower()
         
-        for job in job_listings:
-            progres_count += 1
-            print_progress(progres_count, len(job_listings), f"Vérification des offres pour '{contract_type}'")
-            
-            # Si déjà identifié comme correspondant au type de contrat, l'ajouter directement
-            if (contract_type.lower() == 'alternance' and job['is_alternance']) or \
-               contract_type.lower() in job['contract_type'].lower():
-                filtered_listings.append(job)
-            else:
-                # Sinon, récupérer les détails pour vérifier le type de contrat
-                job_details = fetch_job_details(job['link'])
-                if job_details and contract_type.lower() in job_details.lower():
-                    job['job_details_text'] = job_details  # Sauvegarder les détails pour éviter de refaire la requête
-                    filtered_listings.append(job)
+        # Sinon, récupérer les détails en parallèle pour vérifier le type de contrat
+        jobs_to_check = [job for job in job_listings if not matches_listing(job)]
+        matched_links = set()
         
-        job_listings = filtered_listings
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(fetch_job_details, job.link): job for job in jobs_to_check}
+            for progres_count, future in enumerate(as_completed(futures), 1):
+                print_progress(progres_count, len(futures), f"Vérification des offres pour '{contract_type}'")
+                job = futures[future]
+                job_details = future.result()
+                if job_details and contract_type_lower in job_details.lower():
+                    job.job_details_text = job_details  # Sauvegarder les détails pour éviter de refaire la requête
+                    matched_links.add(job.link)
+        
+        job_listings = [job for job in job_listings if matches_listing(job) or job.link in matched_links]
         print_success(f"{len(job_listings)} offres correspondent au type de contrat '{contract_type}'")
     
     return job_listings
 
+def _details_cache_path(url):
+    """Retourne le chemin du fichier de cache des détails associé à une URL."""
+    return os.path.join(DETAILS_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".txt")
+
+def _read_cached_details(url):
+    """Retourne les détails en cache pour cette URL s'ils ont moins de CACHE_TTL secondes, sinon None."""
+    path = _details_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) >= CACHE_TTL:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _write_cached_details(url, details):
+    """Enregistre les détails d'une offre dans le cache disque."""
+    try:
+        os.makedirs(DETAILS_CACHE_DIR, exist_ok=True)
+        with open(_details_cache_path(url), 'w', encoding='utf-8') as f:
+            f.write(details)
+    except OSError as e:
+        print_warning(f"Impossible d'écrire le cache pour {url}: {str(e)}")
+
+def extract_job_description(soup):
+    """
+    Extrait le texte de la description d'une offre depuis sa page analysée.
+    
+    Args:
+        soup (BeautifulSoup): Page de l'offre
+        
+    Returns:
+        str: Contenu de la description de l'offre
+    """
+    # Tenter de trouver la section de description de l'offre
+    description_selectors = [
+        "div.job-description", 
+        "div.description", 
+        "div[data-testid='job-description']",
+        "div[data-cy='jobDescription']",
+        "section.job-description",
+        "div.offer-description",
+        "div.tw-prose"  # Nouveau sélecteur pour HelloWork
+    ]
+    
+    for selector in description_selectors:
+        description_element = soup.select_one(selector)
+        if description_element:
+            return description_element.get_text(strip=True)
+    
+    # Si on ne trouve pas la description avec les sélecteurs spécifiques,
+    # essayons de récupérer tout le contenu principal
+    main_content = soup.select_one("main, article, div.main-content")
+    if main_content:
+        return main_content.get_text(strip=True)
+    
+    # Dernier recours: prendre tout ce qui ressemble à une description
+    all_paragraphs = soup.find_all('p')
+    if all_paragraphs and len(all_paragraphs) > 5:  # Au moins quelques paragraphes
+        content = "\n".join([p.get_text(strip=True) for p in all_paragraphs if len(p.get_text(strip=True)) > 50])
+        if content:
+            return content
+    
+    return "Description non trouvée sur la page de l'offre."
+
+# Détails d'offres récupérés avec succès, mémorisés pour la durée du processus
+# (les échecs ne sont pas mémorisés pour pouvoir être retentés)
+_job_details_memo = {}
+
 def fetch_job_details(url):
     """
     Récupère les détails complets d'une offre d'emploi depuis sa page dédiée.
     
+    Les détails sont lus depuis le cache disque s'ils ont moins de 24h, et les
+    récupérations réussies sont mémorisées pour la durée du processus.
+    
     Args:
         url (str): URL de l'offre d'emploi
         
     Returns:
         str: Contenu complet de la description de l'offre
     """
-    headers = {
-        "User-Agent": get_random_user_agent(),
-        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
-    }
+    cached_details = _job_details_memo.get(url)
+    if cached_details is not None:
+        return cached_details
+    
+    cached_details = _read_cached_details(url)
+    if cached_details is not None:
+        _job_details_memo[url] = cached_details
+        return cached_details
+    
+    headers = get_request_headers()
     
     try:
         print_info(f"Récupération des détails de l'offre : {url}")
-        response = requests.get(url, headers=headers)
+        response = get_with_backoff(SESSION, url, headers)
         
         if response.status_code != 200:
             print_error(f"Erreur lors de la récupération des détails: {response.status_code}")
             return "Impossible de récupérer les détails de l'offre."
         
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Tenter de trouver la section de description de l'offre
-        description_selectors = [
-            "div.job-description", 
-            "div.description", 
-            "div[data-testid='job-description']",
-            "div[data-cy='jobDescription']",
-            "section.job-description",
-            "div.offer-description",
-            "div.tw-prose"  # Nouveau sélecteur pour HelloWork
-        ]
-        
-        for selector in description_selectors:
-            description_element = soup.select_one(selector)
-            if description_element:
-                return description_element.get_text(strip=True)
-        
-        # Si on ne trouve pas la description avec les sélecteurs spécifiques,
-        # essayons de récupérer tout le contenu principal
-        main_content = soup.select_one("main, article, div.main-content")
-        if main_content:
-            return main_content.get_text(strip=True)
-        
-        # Dernier recours: prendre tout ce qui ressemble à une description
-        all_paragraphs = soup.find_all('p')
-        if all_paragraphs and len(all_paragraphs) > 5:  # Au moins quelques paragraphes
-            content = "\n".join([p.get_text(strip=True) for p in all_paragraphs if len(p.get_text(strip=True)) > 50])
-            if content:
-                return content
-        
-        return "Description non trouvée sur la page de l'offre."
+        soup = BeautifulSoup(response.content, "lxml", parse_only=DESCRIPTION_STRAINER)
+        details = extract_job_description(soup)
+        _write_cached_details(url, details)
+        _job_details_memo[url] = details
+        return details
         
     except Exception as e:
         print_error(f"Erreur lors de la récupération des détails de l'offre: {str(e)}")
         return f"Erreur: {str(e)}"
 
+def _is_word_char(char):
+    """Indique si un caractère fait partie d'un mot (équivalent de \\w)."""
+    return char.isalnum() or char == "_"
+
 def extract_skills(description):
     """
     Extrait les compétences potentielles d'un texte de description d'offre
@@ -515,102 +945,149 @@ def extract_skills(description):
     Returns:
         list: Liste des compétences identifiées
     """
-    tech_skills = [
-        "Python", "SQL", "Java", "JavaScript", "TypeScript", "C#", "C\\+\\+", "PHP", "Ruby",
-        "Angular", "React", "Vue", "Node.js", "Django", "Flask", "Spring", "Laravel", "Ruby on Rails",
-        "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "Terraform",
-        "MySQL", "PostgreSQL", "Oracle", "MongoDB", "Cassandra", "Redis",
-        "Hadoop", "Spark", "Kafka", "Airflow", "Databricks", "dbt",
-        "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "Data Mining",
-        "Agile", "Scrum", "DevOps", "CI/CD", "Jenkins", "Git"
-    ]
+    if SKILLS_AUTOMATON is None:
+        found_indexes = set()
+        for match in SKILLS_RE.finditer(description):
+            found_indexes.update(i for i, value in enumerate(match.groups()) if value is not None)
+        return [skill for i, skill in enumerate(TECH_SKILLS) if i in found_indexes]
+    
+    text = description.lower()
+    found_skills = set()
+    for end, skill in SKILLS_AUTOMATON.iter(text):
+        # Garder uniquement les mots entiers (ex: "Java" mais pas dans "JavaScript")
+        start = end - len(skill) + 1
+        if (start == 0 or not _is_word_char(text[start - 1])) and \
+           (end + 1 == len(text) or not _is_word_char(text[end + 1])):
+            found_skills.add(skill)
+    return [skill for skill in TECH_SKILLS if skill in found_skills]
+
+@functools.lru_cache(maxsize=8)
+def extract_cv_skills(cv_text):
+    """
+    Extrait les compétences du CV, mémorisées car le CV est le même pour toutes les lettres
     
-    found_skills = []
-    for skill in tech_skills:
-        if re.search(r'\b' + skill + r'\b', description, re.IGNORECASE):
-            found_skills.append(skill)
+    Args:
+        cv_text (str): Contenu du CV
+        
+    Returns:
+        tuple: Compétences identifiées dans le CV
+    """
+    return tuple(extract_skills(cv_text))
+
+@functools.lru_cache(maxsize=16)
+def load_text_file(path, mtime):
+    """
+    Lit un fichier texte, mémorisé tant que sa date de modification ne change pas
     
-    return found_skills
+    Args:
+        path (str): Chemin du fichier
+        mtime (float): Date de modification du fichier (clé du cache)
+        
+    Returns:
+        str: Contenu du fichier
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
 
-def generate_cover_letter(job_data, cv_path="cv.txt", parcours_path="parcours.txt", infos_perso_path="infos_perso.json"):
+@functools.lru_cache(maxsize=16)
+def load_infos_perso(path, mtime):
     """
-    Génère une lettre de motivation personnalisée basée sur l'offre d'emploi et le CV.
+    Lit le fichier JSON d'informations personnelles, mémorisé tant que sa date de modification ne change pas
+    
+    Args:
+        path (str): Chemin du fichier
+        mtime (float): Date de modification du fichier (clé du cache)
+        
+    Returns:
+        dict: Informations personnelles
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        infos = json.load(file)
+    print_success(f"Informations personnelles chargées depuis {path}")
+    return infos
+
+def load_letter_inputs(cv_path, parcours_path, infos_perso_path):
+    """
+    Charge une seule fois le CV, le parcours et les informations personnelles utilisés pour toutes les lettres
     
     Args:
-        job_data (dict): Informations sur l'offre d'emploi
         cv_path (str): Chemin vers le fichier CV
         parcours_path (str): Chemin vers le fichier parcours
         infos_perso_path (str): Chemin vers le fichier d'informations personnelles
         
+    Returns:
+        tuple: (cv_text, parcours_text, infos_perso), vides pour les fichiers absents
+    """
+    # Récupérer les informations personnelles
+    infos_perso = {}
+    if os.path.exists(infos_perso_path):
+        try:
+            infos_perso = load_infos_perso(infos_perso_path, os.path.getmtime(infos_perso_path))
+        except json.JSONDecodeError:
+            print_warning(f"Le fichier {infos_perso_path} n'est pas un JSON valide.")
+    
+    # Récupérer le CV
+    cv_text = ""
+    if os.path.exists(cv_path):
+        cv_text = load_text_file(cv_path, os.path.getmtime(cv_path))
+    
+    # Récupérer le parcours
+    parcours_text = ""
+    if os.path.exists(parcours_path):
+        parcours_text = load_text_file(parcours_path, os.path.getmtime(parcours_path))
+    
+    return cv_text, parcours_text, infos_perso
+
+def generate_cover_letter(job_data, cv_text, parcours_text, infos_perso):
+    """
+    Génère une lettre de motivation personnalisée basée sur l'offre d'emploi et le CV.
+    
+    Args:
+        job_data (JobListing): Informations sur l'offre d'emploi
+        cv_text (str): Contenu du CV
+        parcours_text (str): Contenu du parcours
+        infos_perso (dict): Informations personnelles
+        
     Returns:
         str: Lettre de motivation générée
     """
     try:
-        # Récupérer les informations personnelles
-        infos_perso = {}
-        if os.path.exists(infos_perso_path):
-            try:
-                with open(infos_perso_path, 'r', encoding='utf-8') as file:
-                    infos_perso = json.load(file)
-                print_success(f"Informations personnelles chargées depuis {infos_perso_path}")
-            except json.JSONDecodeError:
-                print_warning(f"Le fichier {infos_perso_path} n'est pas un JSON valide.")
-        
-        # Récupérer le CV
-        cv_text = ""
-        if os.path.exists(cv_path):
-            with open(cv_path, 'r', encoding='utf-8') as file:
-                cv_text = file.read()
-        else:
-            print_warning(f"Attention: Le fichier CV {cv_path} n'existe pas.")
-            
-        # Récupérer le parcours
-        parcours_text = ""
-        if os.path.exists(parcours_path):
-            with open(parcours_path, 'r', encoding='utf-8') as file:
-                parcours_text = file.read()
-        else:
-            print_warning(f"Attention: Le fichier parcours {parcours_path} n'existe pas.")
-        
         # Récupérer les détails complets de l'offre si pas déjà disponibles
-        if 'job_details_text' in job_data:
-            job_description = job_data['job_details_text']
+        if job_data.job_details_text is not None:
+            job_description = job_data.job_details_text
         else:
-            job_description = fetch_job_details(job_data["link"])
+            job_description = fetch_job_details(job_data.link)
         
         # Extraire les compétences de l'offre et du CV pour personnalisation
         job_skills = extract_skills(job_description)
-        cv_skills = extract_skills(cv_text)
+        cv_skills = extract_cv_skills(cv_text)
         
         # Trouver les compétences communes
-        common_skills = [skill for skill in cv_skills if skill in job_skills]
-        
-        # Date du jour
-        today = datetime.now().strftime("%d/%m/%Y")
+        job_skill_set = set(job_skills)
+        common_skills = [skill for skill in dict.fromkeys(cv_skills) if skill in job_skill_set]
         
         # Créer un destinataire
-        destinataire = f"Service recrutement {job_data['company']}" if job_data['company'] != "Non spécifié" else "Service recrutement"
+        destinataire = f"Service recrutement {job_data.company}" if job_data.company != "Non spécifié" else "Service recrutement"
         
         # Créer un objet
-        objet = f"Candidature au poste de {job_data['title']}"
+        objet = f"Candidature au poste de {job_data.title}"
         
         # Personnaliser la lettre en fonction du type de contrat
         contract_intro = ""
-        if job_data.get('is_alternance', False) or 'alternance' in job_data.get('contract_type', '').lower():
+        if job_data.is_alternance or 'alternance' in job_data.contract_type.lower():
             contract_intro = "en alternance "
-          # Générer la lettre (sans en-tête, directement avec la salutation)
-        letter = f"""Madame, Monsieur,
-
-"""
-          # Utiliser le texte personnalisé si disponible, sinon générer un texte standard
+        # Générer la lettre (sans en-tête, directement avec la salutation)
+        parts = ["Madame, Monsieur,\n\n"]
+        
+        # Utiliser le texte personnalisé si disponible, sinon générer un texte standard
         if infos_perso and 'texte_motivation' in infos_perso:
             # Remplacer "EDF" par le nom de l'entreprise
-            texte_motivation = infos_perso['texte_motivation'].replace("EDF", job_data['company'])
-            letter += texte_motivation
-            letter += "\n\n"
+            texte_motivation = infos_perso['texte_motivation'].replace("EDF", job_data.company)
+            parts.append(texte_motivation)
+            parts.append("\n\n")
         else:            # Introduction standard
-            location_text = f"à {job_data['location']}" if job_data['location'] != 'Non spécifié' else ''
-            letter += f"Suite à votre offre d'emploi pour le poste de {job_data['title']} {contract_intro}{location_text}, je vous présente ma candidature avec enthousiasme.\n\n"
+            location_text = f"à {job_data.location}" if job_data.location != 'Non spécifié' else ''
+            parts.append(f"Suite à votre offre d'emploi pour le poste de {job_data.title} {contract_intro}{location_text}, je vous présente ma candidature avec enthousiasme.\n\n")
             
             # Ajouter des compétences communes si trouvées
             if common_skills:
@@ -620,48 +1097,64 @@ def generate_cover_letter(job_data, cv_path="cv.txt", parcours_path="parcours.tx
                 else:
                     skills_text = common_skills[0]
                 
-                letter += f"Mon profil correspond aux qualifications que vous recherchez, notamment en ce qui concerne {skills_text} comme le montre mon CV ci-joint.\n\n"
+                parts.append(f"Mon profil correspond aux qualifications que vous recherchez, notamment en ce qui concerne {skills_text} comme le montre mon CV ci-joint.\n\n")
             else:
-                letter += "Mon profil correspond aux qualifications que vous recherchez comme le montre mon CV ci-joint.\n\n"
+                parts.append("Mon profil correspond aux qualifications que vous recherchez comme le montre mon CV ci-joint.\n\n")
             
             # Ajouter un extrait du CV
             if cv_text:
                 # Extraire le début du CV (première partie significative)
                 cv_extract = cv_text.split('\n\n')[0] if '\n\n' in cv_text else cv_text[:200]
-                letter += f"{cv_extract}\n\n"
+                parts.append(f"{cv_extract}\n\n")
             
             # Ajouter un extrait du parcours
             if parcours_text:
                 # Extraire le début du parcours (première partie significative)
                 parcours_extract = parcours_text.split('\n\n')[0] if '\n\n' in parcours_text else parcours_text[:200]
-                letter += f"{parcours_extract}\n\n"
+                parts.append(f"{parcours_extract}\n\n")
             
             # Conclusion personnalisée
-            letter += f"Particulièrement intéressé(e) par {job_data['company']}, je souhaite mettre à profit mon expertise pour contribuer à vos projets. Votre recherche de {job_data['title']} correspond parfaitement à mon parcours professionnel et à mes aspirations.\n\n"
-            letter += "Je serais ravi(e) de vous rencontrer pour vous présenter ma motivation et mes compétences lors d'un entretien.\n\n"
-            letter += "Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.\n\n"
+            parts.append(f"Particulièrement intéressé(e) par {job_data.company}, je souhaite mettre à profit mon expertise pour contribuer à vos projets. Votre recherche de {job_data.title} correspond parfaitement à mon parcours professionnel et à mes aspirations.\n\n")
+            parts.append("Je serais ravi(e) de vous rencontrer pour vous présenter ma motivation et mes compétences lors d'un entretien.\n\n")
+            parts.append("Je vous prie d'agréer, Madame, Monsieur, l'expression de mes salutations distinguées.\n\n")
         
         # Signature
         if infos_perso and 'signature' in infos_perso:
-            letter += infos_perso['signature']
+            parts.append(infos_perso['signature'])
         elif infos_perso and 'nom' in infos_perso:
-            letter += f"{infos_perso.get('nom', '[Votre nom]')}\n{infos_perso.get('coordonnees', '[Vos coordonnées]')}"
+            parts.append(f"{infos_perso.get('nom', '[Votre nom]')}\n{infos_perso.get('coordonnees', '[Vos coordonnées]')}")
         else:
-            letter += "[Votre nom]\n[Vos coordonnées]"
-            
+            parts.append("[Votre nom]\n[Vos coordonnées]")
+        
+        letter = "".join(parts)
         return letter
         
     except Exception as e:
         print_error(f"Erreur lors de la génération de la lettre: {str(e)}")
         return f"Erreur: Impossible de générer la lettre - {str(e)}"
 
-def save_cover_letter(job_data, letter_text):
+def safe_filename_part(text):
+    """
+    Convertit un texte en fragment de nom de fichier ASCII (ex. "Café Paris" -> "Cafe_Paris")
+    
+    Args:
+        text (str): Texte à convertir
+        
+    Returns:
+        str: Fragment sans accents, ponctuation ni espaces
+    """
+    # Décomposer les caractères accentués puis ne garder que la partie ASCII
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return ascii_text.translate(FILENAME_TABLE).strip('_')
+
+def save_cover_letter(job_data, letter_text, date_str=None):
     """
     Enregistre la lettre de motivation dans un fichier texte.
     
     Args:
-        job_data (dict): Informations sur l'offre d'emploi
+        job_data (JobListing): Informations sur l'offre d'emploi
         letter_text (str): Contenu de la lettre de motivation
+        date_str (str, optional): Préfixe de date du fichier (AAAAMMJJ). Par défaut la date du jour.
         
     Returns:
         str: Chemin du fichier créé
@@ -672,28 +1165,88 @@ def save_cover_letter(job_data, letter_text):
         os.makedirs(letters_dir)
     
     # Créer un nom de fichier à partir de l'entreprise et du titre du poste
-    company_name = re.sub(r'[^\w\s-]', '', job_data['company']).strip()
-    job_title = re.sub(r'[^\w\s-]', '', job_data['title']).strip()
-    
-    company_name = company_name.replace(' ', '_')
-    job_title = job_title.replace(' ', '_')
+    company_name = safe_filename_part(job_data.company)
+    job_title = safe_filename_part(job_data.title)
     
     # Ajouter la date pour éviter les doublons
-    date_str = datetime.now().strftime("%Y%m%d")
+    if date_str is None:
+        date_str = datetime.now().strftime("%Y%m%d")
     
     filename = f"{date_str}_{company_name}_{job_title}.txt"
     filepath = os.path.join(letters_dir, filename)
     
-    # Écrire la lettre dans le fichier
+    # Écrire la lettre dans le fichier : encodée une seule fois puis écrite en binaire, en un appel
+    # (fins de ligne converties comme le ferait le mode texte, ex. \r\n sous Windows)
+    if os.linesep != "\n":
+        letter_text = letter_text.replace("\n", os.linesep)
+    letter_bytes = letter_text.encode('utf-8')
     try:
-        with open(filepath, 'w', encoding='utf-8') as file:
-            file.write(letter_text)
+        with open(filepath, 'wb') as file:
+            file.write(letter_bytes)
         
         return filepath
-    except Exception as e:
+    except OSError as e:
         print_error(f"Erreur lors de l'enregistrement de la lettre: {str(e)}")
         return None
 
+def build_sheet_row(values, bold=False):
+    """
+    Construit une ligne au format RowData de l'API Google Sheets v4
+    
+    Args:
+        values (list): Valeurs de la ligne, écrites telles quelles (comme valueInputOption RAW)
+        bold (bool): Mettre le texte de la ligne en gras
+        
+    Returns:
+        dict: La ligne au format RowData
+    """
+    cell_format = {"userEnteredFormat": {"textFormat": {"bold": True}}} if bold else {}
+    return {"values": [{"userEnteredValue": {"stringValue": str(value)}, **cell_format} for value in values]}
+
+# Client gspread autorisé, créé une seule fois par processus
+_gspread_client = None
+
+def get_gspread_client():
+    """
+    Retourne le client gspread autorisé, en le créant au premier appel
+    
+    Les appels suivants réutilisent le même client (et son jeton OAuth).
+    
+    Returns:
+        gspread.Client: Le client autorisé, ou None si aucun credentials n'est configuré
+        ou si les bibliothèques Google ne sont pas installées
+    """
+    global _gspread_client
+    if _gspread_client is not None:
+        return _gspread_client
+    
+    try:
+        import gspread
+        from oauth2client.service_account import ServiceAccountCredentials
+    except ImportError as e:
+        print_error(f"Bibliothèques Google Sheets non installées ({e}). Installez les dépendances de requirements.txt.")
+        return None
+    
+    # Vérifier si le fichier credentials.json existe
+    if os.path.exists('credentials.json'):
+        # Utiliser le fichier credentials.json s'il existe
+        credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', SHEETS_SCOPE)
+    else:
+        # Sinon, utiliser les credentials depuis les variables d'environnement
+        credentials_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
+        if not credentials_json:
+            print_error("Aucun credentials trouvé (ni dans .env, ni dans credentials.json).")
+            print_info("Créez un projet Google Cloud Platform et configurez les credentials.")
+            return None
+        
+        # Convertir la chaîne JSON en dictionnaire
+        credentials_dict = json.loads(credentials_json)
+        credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, SHEETS_SCOPE)
+    
+    # Créer une instance du client gspread
+    _gspread_client = gspread.authorize(credentials)
+    return _gspread_client
+
 def save_to_google_sheets(job_listings, letters_paths=None, sheet_name="Offres HelloWork"):
     """
     Sauvegarde les offres d'emploi et les liens vers les lettres de motivation dans Google Sheets
@@ -706,31 +1259,24 @@ def save_to_google_sheets(job_listings, letters_paths=None, sheet_name="Offres H
     Returns:
         bool: True si la sauvegarde a réussi, False sinon
     """
+    try:
+        import gspread
+        from google.auth.exceptions import GoogleAuthError
+        from oauth2client.client import Error as OAuth2ClientError
+    except ImportError as e:
+        print_error(f"Bibliothèques Google Sheets non installées ({e}). Installez les dépendances de requirements.txt.")
+        return False
+    
     try:
         print_info("Connexion à Google Sheets...")
         
-        # Définir l'étendue (scope) d'accès à l'API
-        scope = ['https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive']
-        
-        # Vérifier si le fichier credentials.json existe
-        if os.path.exists('credentials.json'):
-            # Utiliser le fichier credentials.json s'il existe
-            credentials = ServiceAccountCredentials.from_json_keyfile_name('credentials.json', scope)
-        else:
-            # Sinon, utiliser les credentials depuis les variables d'environnement
-            credentials_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
-            if not credentials_json:
-                print_error("Aucun credentials trouvé (ni dans .env, ni dans credentials.json).")
-                print_info("Créez un projet Google Cloud Platform et configurez les credentials.")
-                return False
-            
-            # Convertir la chaîne JSON en dictionnaire
-            credentials_dict = json.loads(credentials_json)
-            credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
+        # Client autorisé une seule fois par processus
+        client = get_gspread_client()
+        if client is None:
+            return False
         
-        # Créer une instance du client gspread
-        client = gspread.authorize(credentials)
+        # Lignes à ajouter, au format RowData de l'API Sheets v4
+        rows_data = []
         
         try:
             # Tenter d'ouvrir la feuille existante
@@ -741,36 +1287,34 @@ def save_to_google_sheets(job_listings, letters_paths=None, sheet_name="Offres H
             sheet = client.create(sheet_name).sheet1
             print_info(f"Nouvelle feuille '{sheet_name}' créée avec succès")
             
-            # Définir les en-têtes
-            headers = ["Date", "Titre", "Entreprise", "Localisation", "Type de contrat", "Description", "Lien vers l'offre", "Lien vers la lettre de motivation"]
-            sheet.append_row(headers)
-            
-            # Formater les en-têtes
-            sheet.format('A1:H1', {'textFormat': {'bold': True}})
+            # Les en-têtes (en gras) sont envoyés avec les données, dans la même requête
+            rows_data.append(build_sheet_row(SHEET_HEADERS, bold=True))
         
-        # Préparer les données à ajouter
-        rows_to_add = []
+        # Préparer les données à ajouter (même date d'insertion pour tout le lot)
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        # Répertoire courant lu une seule fois pour rendre absolus les chemins des lettres
+        cwd = os.getcwd()
+        rows_to_add = [None] * len(job_listings)
         for i, job in enumerate(job_listings):
             # Déterminer le lien vers la lettre de motivation
             letter_link = ""
             if letters_paths and i in letters_paths:
                 letter_path = letters_paths[i]
-                letter_link = os.path.abspath(letter_path) if letter_path else ""
+                if letter_path:
+                    letter_link = letter_path if os.path.isabs(letter_path) else os.path.join(cwd, letter_path)
             
-            row = [
-                datetime.now().strftime("%Y-%m-%d"),
-                job.get('title', ""),
-                job.get('company', ""),
-                job.get('location', ""),
-                job.get('contract_type', ""),
-                job.get('description', ""),
-                job.get('link', ""),
-                letter_link
-            ]
-            rows_to_add.append(row)
-          # Ajouter les données à la feuille
+            rows_to_add[i] = (today_str, *SHEET_JOB_FIELDS(job), letter_link)
+        
+        # Ajouter en-têtes, mise en forme et données à la feuille par appels batchUpdate,
+        # par lots de SHEETS_BATCH_ROWS lignes envoyés dans l'ordre pour limiter la taille des requêtes
+        rows_data.extend(build_sheet_row(row) for row in rows_to_add)
+        for start in range(0, len(rows_data), SHEETS_BATCH_ROWS):
+            sheet.spreadsheet.batch_update({"requests": [{"appendCells": {
+                "sheetId": sheet.id,
+                "rows": rows_data[start:start + SHEETS_BATCH_ROWS],
+                "fields": "userEnteredValue,userEnteredFormat.textFormat.bold"
+            }}]})
         if rows_to_add:
-            sheet.append_rows(rows_to_add)
             print_success(f"{len(rows_to_add)} offres ajoutées à Google Sheets")
         
         # Obtenir l'URL de la feuille pour l'afficher à l'utilisateur
@@ -787,7 +1331,10 @@ def save_to_google_sheets(job_listings, letters_paths=None, sheet_name="Offres H
         
         return True
         
-    except Exception as e:
+    except (gspread.exceptions.APIError, gspread.exceptions.GSpreadException, GoogleAuthError, OAuth2ClientError,
+            requests.exceptions.RequestException, OSError, KeyError, ValueError) as e:
+        # Erreurs de l'API Sheets (quota, droits), d'authentification, réseau ou de credentials invalides :
+        # la session interactive continue, seule la sauvegarde est signalée en échec
         print_error(f"Erreur lors de la sauvegarde dans Google Sheets: {str(e)}")
         return False
 
@@ -831,26 +1378,83 @@ def generate_and_save_all_cover_letters(job_listings):
         print_warning(f"Fichier d'informations personnelles introuvable: {infos_perso_path}")
         print_info("Les lettres seront générées avec des placeholders [Votre nom] et [Vos coordonnées].")
     
-    # Générer les lettres avec une barre de progression
-    for i, job in enumerate(job_listings):
+    # Lire les fichiers une seule fois pour toutes les lettres
+    cv_text, parcours_text, infos_perso = load_letter_inputs(cv_path, parcours_path, infos_perso_path)
+    
+    # Récupérer en parallèle les détails des offres qui ne les ont pas encore (mémorisés par fetch_job_details)
+    links_to_fetch = list(dict.fromkeys(job.link for job in job_listings if job.job_details_text is None))
+    if links_to_fetch:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(fetch_job_details, link) for link in links_to_fetch]
+            for fetched_count, _ in enumerate(as_completed(futures), 1):
+                print_progress(fetched_count, len(futures), "Récupération des détails des offres")
+    
+    # Générer les lettres avec une barre de progression ; un seul thread d'écriture enregistre
+    # les fichiers dans l'ordre pendant que les lettres suivantes sont générées
+    date_str = datetime.now().strftime("%Y%m%d")
+    save_futures = {}
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for i, job in enumerate(job_listings):
+            try:
+                print_progress(i + 1, len(job_listings), "Génération des lettres de motivation")
+                
+                # Générer la lettre
+                letter = generate_cover_letter(job, cv_text, parcours_text, infos_perso)
+                
+                # Enregistrer la lettre
+                save_futures[i] = writer.submit(save_cover_letter, job, letter, date_str)
+                    
+            except Exception as e:
+                print_error(f"Erreur lors du traitement de l'offre {job.title}: {str(e)}")
+    
+    for i, future in save_futures.items():
         try:
-            print_progress(i + 1, len(job_listings), "Génération des lettres de motivation")
-            
-            # Générer la lettre
-            letter = generate_cover_letter(job, cv_path, parcours_path, infos_perso_path)
-            
-            # Enregistrer la lettre
-            filepath = save_cover_letter(job, letter)
-            
+            filepath = future.result()
             if filepath:
                 letter_paths[i] = filepath
-                
         except Exception as e:
-            print_error(f"Erreur lors du traitement de l'offre {job['title']}: {str(e)}")
+            print_error(f"Erreur lors du traitement de l'offre {job_listings[i].title}: {str(e)}")
     
     print_success(f"\n{len(letter_paths)} lettres de motivation ont été générées avec succès.")
     return letter_paths
 
+def read_state_file(path):
+    """
+    Lit un fichier de sauvegarde JSON en une seule lecture
+    
+    Args:
+        path (str): Chemin du fichier de sauvegarde
+        
+    Returns:
+        dict: L'état sauvegardé
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+@functools.lru_cache(maxsize=64)
+def read_state_summary(path, mtime):
+    """
+    Lit le résumé d'une ancienne sauvegarde (sans résumé dans son nom), mémorisé tant que
+    sa date de modification ne change pas
+    
+    Args:
+        path (str): Chemin du fichier de sauvegarde
+        mtime (float): Date de modification du fichier (clé du cache)
+        
+    Returns:
+        tuple: (job_title, location, job_count)
+    """
+    state = read_state_file(path)
+    search = state.get('search_params', {})
+    return (search.get('job_title', 'Inconnu'),
+            search.get('location', 'Non spécifié'),
+            len(state.get('job_listings', [])))
+
+def _state_filename_part(text):
+    """Nettoie un paramètre de recherche pour l'inclure dans le nom du fichier de sauvegarde."""
+    return "_".join(part for part in text.translate(FILENAME_TABLE).split("_") if part)[:50]
+
 def save_scraping_state(job_listings, search_params):
     """
     Sauvegarde l'état actuel du scraping pour permettre une reprise ultérieure
@@ -863,20 +1467,29 @@ def save_scraping_state(job_listings, search_params):
         os.makedirs('saves')
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"saves/scraping_state_{timestamp}.json"
+    # Le résumé affiché dans le menu de reprise est encodé dans le nom du fichier
+    job_title = _state_filename_part(search_params.get('job_title') or '')
+    location = _state_filename_part(search_params.get('location') or '')
+    filename = f"saves/scraping_state_{timestamp}__{job_title}__{location}__{len(job_listings)}.json"
     
     state = {
-        "job_listings": job_listings,
+        "job_listings": [asdict(job) for job in job_listings],
         "search_params": search_params,
         "timestamp": timestamp
     }
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(state, f, ensure_ascii=False, indent=2)
+        # Sérialiser en mémoire puis écrire en une fois avec un tampon de 1 Mo
+        if orjson is not None:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(state, ensure_ascii=False, indent=2).encode('utf-8')
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(data)
         print_success(f"État du scraping sauvegardé dans {filename}")
         return filename
-    except Exception as e:
+    except (OSError, TypeError) as e:
+        # TypeError : donnée non sérialisable (orjson.JSONEncodeError en hérite)
         print_error(f"Erreur lors de la sauvegarde de l'état: {str(e)}")
         return None
 
@@ -895,35 +1508,41 @@ def load_scraping_state(filename=None):
         return None, None
     
     if not filename:
-        # Lister les sauvegardes disponibles
-        saves = [f for f in os.listdir('saves') if f.startswith('scraping_state_')]
+        # Lister les sauvegardes disponibles (dans l'ordre chronologique)
+        with os.scandir('saves') as entries:
+            saves = sorted(entry.name for entry in entries
+                           if entry.is_file() and entry.name.startswith('scraping_state_'))
         if not saves:
             print_warning("Aucune sauvegarde trouvée.")
             return None, None
         
         print_section("Sauvegardes disponibles")
         for i, save in enumerate(saves, 1):
-            # Extraire la date/heure du nom de fichier
-            timestamp = save.replace('scraping_state_', '').replace('.json', '')
+            # Extraire la date/heure et le résumé du nom de fichier
+            parts = save[len('scraping_state_'):-len('.json')].split('__')
+            timestamp = parts[0]
             try:
                 # Convertir en objet datetime pour un affichage plus lisible
                 dt = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
                 readable_date = dt.strftime("%d/%m/%Y à %H:%M:%S")
-            except:
+            except ValueError:
                 readable_date = timestamp
             
-            # Lire les infos de base de la sauvegarde
+            if len(parts) == 4:
+                job_title = parts[1].replace('_', ' ') or 'Inconnu'
+                location = parts[2].replace('_', ' ') or 'Non spécifié'
+                print(f"{i}. {save} - {readable_date}")
+                print(f"   Recherche: {job_title} à {location}, {parts[3]} offres trouvées")
+                continue
+            
+            # Anciennes sauvegardes sans résumé dans le nom : lire les infos de base du fichier
             try:
-                with open(os.path.join('saves', save), 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                job_count = len(state.get('job_listings', []))
-                search = state.get('search_params', {})
-                job_title = search.get('job_title', 'Inconnu')
-                location = search.get('location', 'Non spécifié')
+                save_path = os.path.join('saves', save)
+                job_title, location, job_count = read_state_summary(save_path, os.path.getmtime(save_path))
                 
                 print(f"{i}. {save} - {readable_date}")
                 print(f"   Recherche: {job_title} à {location}, {job_count} offres trouvées")
-            except:
+            except (OSError, ValueError, AttributeError):
                 print(f"{i}. {save} - {readable_date} (Erreur de lecture)")
         
         choice = get_user_input("Numéro de la sauvegarde à charger (ou 'q' pour annuler)")
@@ -937,20 +1556,20 @@ def load_scraping_state(filename=None):
             else:
                 print_error("Numéro de sauvegarde invalide.")
                 return None, None
-        except:
+        except ValueError:
             print_error("Entrée invalide.")
             return None, None
     
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            state = json.load(f)
+        state = read_state_file(filename)
         
-        job_listings = state.get('job_listings', [])
+        job_listings = [JobListing.from_dict(job) for job in state.get('job_listings', [])]
         search_params = state.get('search_params', {})
         
         print_success(f"Sauvegarde chargée avec succès: {len(job_listings)} offres.")
         return job_listings, search_params
-    except Exception as e:
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        # Fichier illisible, JSON invalide ou contenu ne correspondant pas au format attendu
         print_error(f"Erreur lors du chargement de la sauvegarde: {str(e)}")
         return None, None
 
@@ -967,79 +1586,16 @@ def identify_contract_type(title, description):
     """
     text = (title + " " + description).lower()
     
-    # Dictionnaire des types de contrat avec leurs mots-clés associés
-    contract_types = {
-        "CDI": ["cdi", "contrat à durée indéterminée", "permanent", "indéterminée"],
-        "CDD": ["cdd", "contrat à durée déterminée", "déterminée", "temporaire"],
-        "Alternance": ["altern", "apprentissage", "apprenti", "contrat pro", "professionnalisation"],
-        "Stage": ["stage", "stagiaire", "internship", "intern"],
-        "Freelance": ["freelance", "indépendant", "consultant externe", "auto-entrepreneur"],
-        "Intérim": ["intérim", "mission temporaire", "mission d'intérim"],
-        "Temps partiel": ["temps partiel", "mi-temps", "part-time"],
-        "Temps plein": ["temps plein", "temps complet", "full-time"]
-    }
-    
-    # Recherche des mots-clés dans le texte
-    detected_types = []
-    for contract_type, keywords in contract_types.items():
-        for keyword in keywords:
-            if keyword in text:
-                detected_types.append(contract_type)
-                break
-    
-    # Si plusieurs types détectés, prioriser
-    if "CDI" in detected_types and "CDD" in detected_types:
-        # Si les deux sont mentionnés, regarder lequel est mentionné en premier
-        if "cdi" in text.split("cdd")[0]:
-            primary_type = "CDI"
-        else:
-            primary_type = "CDD"
-    elif detected_types:
-        primary_type = detected_types[0]
-    else:
-        primary_type = "Non spécifié"
-    
-    # Construire le résultat
-    result = {
-        "contract_type": primary_type,
-        "is_alternance": "Alternance" in detected_types,
-        "is_cdi": "CDI" in detected_types,
-        "is_cdd": "CDD" in detected_types,
-        "is_stage": "Stage" in detected_types,
-        "is_freelance": "Freelance" in detected_types,
-        "is_interim": "Intérim" in detected_types,
-        "is_part_time": "Temps partiel" in detected_types,
-        "is_full_time": "Temps plein" in detected_types,
-        "all_detected_types": detected_types
-    }
-    
-    return result
-    text = (title + " " + description).lower()
-    
-    # Dictionnaire des types de contrat avec leurs mots-clés associés
-    contract_types = {
-        "CDI": ["cdi", "contrat à durée indéterminée", "permanent", "indéterminée"],
-        "CDD": ["cdd", "contrat à durée déterminée", "déterminée", "temporaire"],
-        "Alternance": ["altern", "apprentissage", "apprenti", "contrat pro", "professionnalisation"],
-        "Stage": ["stage", "stagiaire", "internship", "intern"],
-        "Freelance": ["freelance", "indépendant", "consultant externe", "auto-entrepreneur"],
-        "Intérim": ["intérim", "mission temporaire", "mission d'intérim"],
-        "Temps partiel": ["temps partiel", "mi-temps", "part-time"],
-        "Temps plein": ["temps plein", "temps complet", "full-time"]
-    }
-    
-    # Recherche des mots-clés dans le texte
-    detected_types = []
-    for contract_type, keywords in contract_types.items():
-        for keyword in keywords:
-            if keyword in text:
-                detected_types.append(contract_type)
-                break
+    # Recherche de tous les mots-clés en une seule passe sur le texte
+    found_types = {CONTRACT_GROUPS[match.lastgroup] for match in CONTRACT_RE.finditer(text)}
+    detected_types = [contract_type for contract_type in CONTRACT_TYPES if contract_type in found_types]
     
     # Si plusieurs types détectés, prioriser
-    if "CDI" in detected_types and "CDD" in detected_types:
+    if "CDI" in found_types and "CDD" in found_types:
         # Si les deux sont mentionnés, regarder lequel est mentionné en premier
-        if "cdi" in text.split("cdd")[0]:
+        cdi_position = text.find("cdi")
+        cdd_position = text.find("cdd")
+        if cdi_position != -1 and (cdd_position == -1 or cdi_position < cdd_position):
             primary_type = "CDI"
         else:
             primary_type = "CDD"
@@ -1051,14 +1607,14 @@ def identify_contract_type(title, description):
     # Construire le résultat
     result = {
         "contract_type": primary_type,
-        "is_alternance": "Alternance" in detected_types,
-        "is_cdi": "CDI" in detected_types,
-        "is_cdd": "CDD" in detected_types,
-        "is_stage": "Stage" in detected_types,
-        "is_freelance": "Freelance" in detected_types,
-        "is_interim": "Intérim" in detected_types,
-        "is_part_time": "Temps partiel" in detected_types,
-        "is_full_time": "Temps plein" in detected_types,
+        "is_alternance": "Alternance" in found_types,
+        "is_cdi": "CDI" in found_types,
+        "is_cdd": "CDD" in found_types,
+        "is_stage": "Stage" in found_types,
+        "is_freelance": "Freelance" in found_types,
+        "is_interim": "Intérim" in found_types,
+        "is_part_time": "Temps partiel" in found_types,
+        "is_full_time": "Temps plein" in found_types,
         "all_detected_types": detected_types
     }
     
@@ -1079,13 +1635,13 @@ def interactive_mode():
                 print_section("Résumé des offres chargées")
                 for i, job in enumerate(job_listings, 1):
                     contract_info = ""
-                    if job.get('is_alternance', False):
+                    if job.is_alternance:
                         contract_info = f" {Fore.CYAN}[Alternance]{Style.RESET_ALL}"
-                    elif job.get('contract_type', "") != "Non spécifié" and job.get('contract_type', "") != "À déterminer":
-                        contract_info = f" {Fore.CYAN}[{job.get('contract_type', '')}]{Style.RESET_ALL}"
+                    elif job.contract_type != "Non spécifié" and job.contract_type != "À déterminer":
+                        contract_info = f" {Fore.CYAN}[{job.contract_type}]{Style.RESET_ALL}"
                         
-                    print(f"{i}. {Fore.YELLOW}{job['title']}{Style.RESET_ALL} - {job['company']} - {job['location']}{contract_info}")
-                    print(f"   {Fore.BLUE}{job['link']}{Style.RESET_ALL}")
+                    print(f"{i}. {Fore.YELLOW}{job.title}{Style.RESET_ALL} - {job.company} - {job.location}{contract_info}")
+                    print(f"   {Fore.BLUE}{job.link}{Style.RESET_ALL}")
                 
                 # Aller directement aux actions
                 goto_actions(job_listings)
@@ -1123,7 +1679,7 @@ def interactive_mode():
     print_section("Scraping des offres d'emploi")
     
     # Scraper les offres d'emploi
-    job_listings = scrape_job_listings(job_title, location, max_pages, contract_type, proxies if use_proxies else None)
+    job_listings = scrape_job_listings(job_title, location, max_pages, contract_type, proxies if use_proxies else [])
     
     if not job_listings:
         print_warning("Aucune offre d'emploi trouvée correspondant à vos critères.")
@@ -1138,13 +1694,13 @@ def interactive_mode():
     print_section("Résumé des offres trouvées")
     for i, job in enumerate(job_listings, 1):
         contract_info = ""
-        if job.get('is_alternance', False):
+        if job.is_alternance:
             contract_info = f" {Fore.CYAN}[Alternance]{Style.RESET_ALL}"
-        elif job.get('contract_type', "") != "Non spécifié" and job.get('contract_type', "") != "À déterminer":
-            contract_info = f" {Fore.CYAN}[{job.get('contract_type', '')}]{Style.RESET_ALL}"
+        elif job.contract_type != "Non spécifié" and job.contract_type != "À déterminer":
+            contract_info = f" {Fore.CYAN}[{job.contract_type}]{Style.RESET_ALL}"
             
-        print(f"{i}. {Fore.YELLOW}{job['title']}{Style.RESET_ALL} - {job['company']} - {job['location']}{contract_info}")
-        print(f"   {Fore.BLUE}{job['link']}{Style.RESET_ALL}")
+        print(f"{i}. {Fore.YELLOW}{job.title}{Style.RESET_ALL} - {job.company} - {job.location}{contract_info}")
+        print(f"   {Fore.BLUE}{job.link}{Style.RESET_ALL}")
     
     # Passer aux actions
     goto_actions(job_listings)
@@ -1178,18 +1734,35 @@ def goto_actions(job_listings):
     # Enregistrer en CSV local
     save_csv = get_yes_no("Voulez-vous sauvegarder les offres dans un fichier CSV local ?")
     if save_csv:
-        csv_filename = get_user_input("Nom du fichier CSV", f"offres_{job_listings[0].get('title', 'hellowork').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv")
+        csv_filename = get_user_input("Nom du fichier CSV", f"offres_{(job_listings[0].title or 'hellowork').replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv")
         
         try:
-            # Créer un DataFrame pandas
-            df = pd.DataFrame(job_listings)
-            
-            # Ajouter les liens vers les lettres de motivation
+            # Préparer les lignes, avec les liens vers les lettres de motivation
+            rows = [asdict(job) for job in job_listings]
             if letter_paths:
-                df['cover_letter_path'] = df.index.map(lambda i: letter_paths.get(i, ""))
+                for i, row in enumerate(rows):
+                    row['cover_letter_path'] = letter_paths.get(i, "")
+            # Toutes les valeurs en texte ("True"/"False", "" pour les valeurs absentes) pour que
+            # pyarrow et pandas écrivent exactement le même fichier
+            rows = [{name: "" if value is None else str(value) for name, value in row.items()} for row in rows]
             
-            # Sauvegarder en CSV
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            # Sauvegarder en CSV, avec le writer C++ de pyarrow s'il est installé, sinon pandas.
+            # Tous les champs sont entre guillemets (pyarrow met toujours les textes entre guillemets)
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pacsv
+            except ImportError:
+                pa = None
+            if pa is not None:
+                schema = pa.schema([(name, pa.string()) for name in rows[0]])
+                with open(csv_filename, 'wb', buffering=1 << 20) as f:
+                    f.write(b'\xef\xbb\xbf')  # BOM UTF-8 pour Excel, comme l'encodage utf-8-sig
+                    pacsv.write_csv(pa.Table.from_pylist(rows, schema=schema), f,
+                                    pacsv.WriteOptions(quoting_style="all_valid"))
+            else:
+                import pandas as pd
+                pd.DataFrame(rows).to_csv(csv_filename, index=False, encoding='utf-8-sig',
+                                          quoting=csv.QUOTE_ALL, lineterminator="\n")
             print_success(f"Offres sauvegardées dans {csv_filename}!")
         except Exception as e:
             print_error(f"Erreur lors de la sauvegarde en CSV: {str(e)}")
@@ -1201,8 +1774,14 @@ def goto_actions(job_listings):
         print_section("Fin du programme")
         print_success("Merci d'avoir utilisé HelloWork Job Scraper!")
 
-def main():
-    """Fonction principale exécutant le programme en mode interactif ou par ligne de commande."""
+def main(argv=None):
+    """
+    Fonction principale exécutant le programme en mode interactif ou par ligne de commande.
+    
+    Args:
+        argv (list, optional): Arguments de la ligne de commande (par défaut sys.argv[1:]),
+            pour un appel depuis un autre script comme lancer_scraper.py
+    """
     parser = argparse.ArgumentParser(description='Scraper les offres d\'emploi HelloWork et générer des lettres de motivation')
     parser.add_argument('--interactive', action='store_true', help='Exécuter en mode interactif (recommandé)')
     parser.add_argument('--job', help='Titre du poste à rechercher')
@@ -1211,8 +1790,9 @@ def main():
     parser.add_argument('--pages', type=int, default=1, help='Nombre de pages à scraper')
     parser.add_argument('--generate-letters', action='store_true', help='Générer des lettres de motivation pour chaque offre')
     parser.add_argument('--sheet-name', default='Offres HelloWork', help='Nom de la feuille Google Sheets')
+    parser.add_argument('--debug', action='store_true', help='Sauvegarder le HTML des pages de résultats dans debug/')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         # Mode interactif (par défaut)
@@ -1224,7 +1804,7 @@ def main():
         print_header()
         
         # Scraper les offres d'emploi
-        job_listings = scrape_job_listings(args.job, args.location, args.pages, args.contrat)
+        job_listings = scrape_job_listings(args.job, args.location, args.pages, args.contrat, debug=args.debug)
         
         if not job_listings:
             print_warning("Aucune offre d'emploi trouvée.")
@@ -1233,8 +1813,8 @@ def main():
         # Afficher un résumé des offres trouvées
         print_section("Résumé des offres trouvées")
         for i, job in enumerate(job_listings, 1):
-            print(f"{i}. {job['title']} - {job['company']} - {job['location']}")
-            print(f"   {job['link']}")
+            print(f"{i}. {job.title} - {job.company} - {job.location}")
+            print(f"   {job.link}")
         
         # Générer des lettres de motivation si demandé
         letter_paths = {}
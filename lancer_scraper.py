@@ -9,109 +9,240 @@ et en exécutant le script interactif avec les bonnes options.
 
 import os
 import sys
-import subprocess
 import time
-import pkg_resources
+import functools
 
 # Couleurs pour terminal
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+HEADER = '\033[95m'
+BLUE = '\033[94m'
+CYAN = '\033[96m'
+GREEN = '\033[92m'
+WARNING = '\033[93m'
+FAIL = '\033[91m'
+ENDC = '\033[0m'
+BOLD = '\033[1m'
+UNDERLINE = '\033[4m'
+
+# Séquence ANSI d'effacement de l'écran (efface puis replace le curseur en haut à gauche)
+CLEAR = "\033[2J\033[H"
+
+# Préfixe et suffixe de chaque type de message, calculés une seule fois
+FORMATS_MESSAGE = {
+    "info": (f"{BLUE}[INFO]{ENDC} ", "\n"),
+    "success": (f"{GREEN}[SUCCÈS]{ENDC} ", "\n"),
+    "warning": (f"{WARNING}[ATTENTION]{ENDC} ", "\n"),
+    "error": (f"{FAIL}[ERREUR]{ENDC} ", "\n"),
+    "header": (f"\n{HEADER}{BOLD}", f"{ENDC}\n\n"),
+}
+
+# Paquets importés par hellowork_scraper_interactive.py (argparse fait partie de la bibliothèque standard)
+REQUIRED_PACKAGES = (
+    "requests", "beautifulsoup4", "lxml", "gspread", "google-auth",
+    "oauth2client", "pandas", "colorama", "python-dotenv"
+)
+
+# Fichier témoin d'une vérification des dépendances réussie
+FICHIER_STAMP_DEPENDANCES = ".deps_ok"
+
+# Fichiers nécessaires au scraper et à la génération des lettres
+FICHIERS_ESSENTIELS = (
+    "hellowork_scraper_interactive.py",
+    "cv.txt",
+    "parcours.txt",
+    "infos_perso.json"
+)
+
+# Fichiers d'authentification Google (au moins un des deux)
+FICHIERS_AUTH = ("credentials.json", ".env")
+
+# Textes statiques du menu et de l'aide, construits une seule fois et écrits en un seul appel
+TEXTE_MENU = (
+    f"{BOLD}1.{ENDC} Lancer le scraper en mode interactif\n"
+    f"{BOLD}2.{ENDC} Vérifier l'environnement et les dépendances\n"
+    f"{BOLD}3.{ENDC} Afficher l'aide\n"
+    f"{BOLD}4.{ENDC} Quitter\n"
+)
+
+TEXTE_AIDE = """\
+Ce script vous permet de scraper les offres d'emploi sur HelloWork et de générer
+des lettres de motivation personnalisées pour chaque offre.
+
+Options disponibles :
+1. Mode interactif : Vous guide à travers les étapes pour rechercher et traiter les offres d'emploi
+2. Vérification de l'environnement : S'assure que toutes les dépendances sont installées
+
+Pour fonctionner correctement, le script nécessite les fichiers suivants :
+- hellowork_scraper_interactive.py : Le script principal
+- cv.txt : Votre CV au format texte
+- parcours.txt : Description de votre parcours professionnel
+- infos_perso.json : Vos informations personnelles pour les lettres de motivation
+- .env ou credentials.json : Vos identifiants Google API (pour l'accès à Google Sheets)
+"""
+
+def effacer_ecran():
+    """Efface le terminal sans lancer de processus externe"""
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
 
 def afficher_message(message, type_message="info"):
     """Affiche un message formaté dans le terminal"""
-    if type_message == "info":
-        print(f"{Colors.BLUE}[INFO]{Colors.ENDC} {message}")
-    elif type_message == "success":
-        print(f"{Colors.GREEN}[SUCCÈS]{Colors.ENDC} {message}")
-    elif type_message == "warning":
-        print(f"{Colors.WARNING}[ATTENTION]{Colors.ENDC} {message}")
-    elif type_message == "error":
-        print(f"{Colors.FAIL}[ERREUR]{Colors.ENDC} {message}")
-    elif type_message == "header":
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{message}{Colors.ENDC}\n")
+    format_message = FORMATS_MESSAGE.get(type_message)
+    if format_message is None:
+        return
+    prefixe, suffixe = format_message
+    sys.stdout.write(f"{prefixe}{message}{suffixe}")
 
+def cle_dependances():
+    """
+    Calcule la clé du fichier témoin des dépendances
+    
+    La clé change avec la liste des paquets requis, la version de Python ou l'interpréteur
+    utilisé (un autre environnement virtuel invalide donc le témoin).
+    
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    import hashlib
+    
+    donnees = f"{REQUIRED_PACKAGES!r}|{sys.version}|{sys.executable}".encode("utf-8")
+    return hashlib.blake2s(donnees).hexdigest()
+
+def invalider_stamp_dependances():
+    """Supprime le fichier témoin pour forcer une vérification complète au prochain lancement"""
+    try:
+        os.remove(FICHIER_STAMP_DEPENDANCES)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
 def verifier_dependances():
-    """Vérifie que toutes les dépendances requises sont installées"""
-    required_packages = [
-        "requests", "beautifulsoup4", "gspread", "google-auth", 
-        "oauth2client", "pandas", "tqdm", "argparse", "colorama", "python-dotenv"
-    ]
+    """
+    Vérifie que toutes les dépendances requises sont installées
+    
+    Le résultat est mémorisé pour la session ; le cache est vidé après une installation
+    ou lorsqu'il manque des dépendances, pour que la vérification suivante soit refaite.
+    Une vérification réussie est aussi enregistrée dans un fichier témoin : tant que sa clé
+    correspond, les lancements suivants ne relisent pas les métadonnées des paquets.
+    """
+    cle = cle_dependances()
+    try:
+        with open(FICHIER_STAMP_DEPENDANCES, encoding="utf-8") as f:
+            if f.read() == cle:
+                return ()
+    except OSError:
+        pass
+    
+    from importlib.metadata import distributions
     
-    missing_packages = []
+    # Noms des distributions installées, lus en une seule passe (normalisés : minuscules, "-" au lieu de "_")
+    installed = {dist.metadata["Name"].lower().replace("_", "-") for dist in distributions() if dist.metadata["Name"]}
     
-    for package in required_packages:
+    missing_packages = tuple(package for package in REQUIRED_PACKAGES if package.lower() not in installed)
+    
+    if not missing_packages:
         try:
-            pkg_resources.get_distribution(package)
-        except pkg_resources.DistributionNotFound:
-            missing_packages.append(package)
+            with open(FICHIER_STAMP_DEPENDANCES, "w", encoding="utf-8") as f:
+                f.write(cle)
+        except OSError:
+            pass
     
     return missing_packages
 
 def installer_dependances(packages):
     """Installe les dépendances manquantes"""
+    import subprocess
+    
     afficher_message(f"Installation des dépendances manquantes: {', '.join(packages)}", "info")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + packages)
+        # Une seule invocation de pip, sans vérification de sa propre version et en préférant les wheels
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                               "--no-input", "--prefer-binary", *packages])
+        verifier_dependances.cache_clear()
         afficher_message("Installation des dépendances terminée avec succès", "success")
         return True
     except subprocess.CalledProcessError:
+        invalider_stamp_dependances()
         afficher_message("Erreur lors de l'installation des dépendances", "error")
         return False
 
+@functools.lru_cache(maxsize=1)
 def verifier_fichiers_essentiels():
-    """Vérifie que tous les fichiers essentiels sont présents"""
-    fichiers_essentiels = [
-        "hellowork_scraper_interactive.py",
-        "cv.txt",
-        "parcours.txt",
-        "infos_perso.json"
-    ]
+    """
+    Vérifie que tous les fichiers essentiels sont présents
     
-    # Au moins un des fichiers d'authentification Google doit être présent
-    fichiers_auth = ["credentials.json", ".env"]
-    auth_present = False
+    Le résultat est mémorisé pour la session ; le cache est vidé lorsqu'il manque des
+    fichiers, pour que la vérification suivante voie ceux créés entre-temps.
+    """
+    # Lister le répertoire courant une seule fois plutôt qu'un stat par fichier
+    with os.scandir('.') as entries:
+        presents = {entry.name for entry in entries}
     
-    for fichier in fichiers_auth:
-        if os.path.exists(fichier):
-            auth_present = True
-            break
+    # Au moins un des fichiers d'authentification Google doit être présent
+    auth_present = not presents.isdisjoint(FICHIERS_AUTH)
     
+    fichiers_essentiels = FICHIERS_ESSENTIELS
     if not auth_present:
-        fichiers_essentiels.append("credentials.json ou .env")
+        fichiers_essentiels += ("credentials.json ou .env",)
     
     fichiers_manquants = []
     for fichier in fichiers_essentiels:
         if "ou" in fichier:
             # Cas spécial pour les alternatives
             continue
-        elif not os.path.exists(fichier):
+        elif fichier not in presents:
             fichiers_manquants.append(fichier)
     
-    return fichiers_manquants
+    return tuple(fichiers_manquants)
+
+def verifier_environnement():
+    """
+    Vérifie en parallèle les dépendances et les fichiers essentiels
+    
+    Les deux vérifications sont indépendantes (lecture des métadonnées des paquets
+    d'un côté, listing du répertoire de l'autre) ; elles sont lancées dans deux threads
+    et le temps d'attente est celui de la plus longue plutôt que leur somme.
+    
+    Returns:
+        tuple: (dépendances manquantes, fichiers manquants)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_dependances = executor.submit(verifier_dependances)
+        future_fichiers = executor.submit(verifier_fichiers_essentiels)
+        return future_dependances.result(), future_fichiers.result()
 
 def lancer_scraper(mode="interactive"):
-    """Lance le scraper HelloWork"""
-    script_path = "hellowork_scraper_interactive.py"
+    """
+    Lance le scraper HelloWork dans le processus courant
     
+    Le script est importé comme module plutôt que lancé dans un second interpréteur ;
+    les modules déjà importés restent disponibles d'un lancement à l'autre.
+    
+    Args:
+        mode (str): Mode de lancement du scraper
+    """
     afficher_message("Lancement du scraper HelloWork...", "info")
     
     if mode == "interactive":
-        commande = [sys.executable, script_path, "--interactive"]
+        arguments = ["--interactive"]
     else:
         # Ajoutez ici d'autres modes si nécessaire
-        commande = [sys.executable, script_path, "--interactive"]
+        arguments = ["--interactive"]
     
     try:
-        subprocess.call(commande)
+        # Prendre en compte les paquets éventuellement installés depuis le démarrage
+        import importlib
+        importlib.invalidate_caches()
+        import hellowork_scraper_interactive
+        
+        hellowork_scraper_interactive.main(arguments)
         return True
+    except ImportError as e:
+        # Une dépendance a disparu depuis la dernière vérification : le témoin n'est plus fiable
+        invalider_stamp_dependances()
+        afficher_message(f"Erreur lors de l'exécution du scraper: {str(e)}", "error")
+        return False
     except Exception as e:
         afficher_message(f"Erreur lors de l'exécution du scraper: {str(e)}", "error")
         return False
@@ -119,10 +250,7 @@ def lancer_scraper(mode="interactive"):
 def afficher_menu():
     """Affiche le menu principal"""
     afficher_message("SCRAPER HELLOWORK - MENU PRINCIPAL", "header")
-    print(f"{Colors.BOLD}1.{Colors.ENDC} Lancer le scraper en mode interactif")
-    print(f"{Colors.BOLD}2.{Colors.ENDC} Vérifier l'environnement et les dépendances")
-    print(f"{Colors.BOLD}3.{Colors.ENDC} Afficher l'aide")
-    print(f"{Colors.BOLD}4.{Colors.ENDC} Quitter")
+    sys.stdout.write(TEXTE_MENU)
     
     choix = input("\nVotre choix (1-4): ")
     return choix
@@ -130,88 +258,110 @@ def afficher_menu():
 def afficher_aide():
     """Affiche l'aide du script"""
     afficher_message("AIDE DU SCRAPER HELLOWORK", "header")
-    print("Ce script vous permet de scraper les offres d'emploi sur HelloWork et de générer")
-    print("des lettres de motivation personnalisées pour chaque offre.")
-    print("\nOptions disponibles :")
-    print("1. Mode interactif : Vous guide à travers les étapes pour rechercher et traiter les offres d'emploi")
-    print("2. Vérification de l'environnement : S'assure que toutes les dépendances sont installées")
-    print("\nPour fonctionner correctement, le script nécessite les fichiers suivants :")
-    print("- hellowork_scraper_interactive.py : Le script principal")
-    print("- cv.txt : Votre CV au format texte")
-    print("- parcours.txt : Description de votre parcours professionnel")
-    print("- infos_perso.json : Vos informations personnelles pour les lettres de motivation")
-    print("- .env ou credentials.json : Vos identifiants Google API (pour l'accès à Google Sheets)")
+    sys.stdout.write(TEXTE_AIDE)
+    input("\nAppuyez sur Entrée pour revenir au menu principal...")
+
+def preparer_lancement():
+    """
+    Vérifie les dépendances (en proposant de les installer) et les fichiers essentiels
+    
+    Returns:
+        bool: True si le scraper peut être lancé
+    """
+    # Vérifier les dépendances et les fichiers avant de lancer
+    missing_packages, fichiers_manquants = verifier_environnement()
+    if fichiers_manquants:
+        verifier_fichiers_essentiels.cache_clear()
+    if missing_packages:
+        verifier_dependances.cache_clear()
+        if not installer_dependances(missing_packages):
+            afficher_message("Impossible de continuer sans les dépendances requises", "error")
+            time.sleep(2)
+            return False
+    
+    # Signaler les fichiers essentiels manquants
+    if fichiers_manquants:
+        afficher_message(f"Fichiers manquants: {', '.join(fichiers_manquants)}", "error")
+        afficher_message("Veuillez créer ou restaurer ces fichiers avant de continuer", "warning")
+        time.sleep(3)
+        return False
+    
+    return True
+
+def action_lancer():
+    """Option 1 du menu : vérifie l'environnement puis lance le scraper"""
+    if not preparer_lancement():
+        return
+    
+    # Lancer le scraper
+    lancer_scraper()
     input("\nAppuyez sur Entrée pour revenir au menu principal...")
 
+def action_verifier():
+    """Option 2 du menu : affiche l'état de l'environnement et propose d'installer les dépendances"""
+    afficher_message("Vérification de l'environnement...", "info")
+    
+    # Vérifier Python
+    python_version = sys.version.split()[0]
+    afficher_message(f"Version de Python: {python_version}", "info")
+    
+    # Vérifier les dépendances et les fichiers essentiels
+    missing_packages, fichiers_manquants = verifier_environnement()
+    if missing_packages:
+        verifier_dependances.cache_clear()
+        afficher_message(f"Dépendances manquantes: {', '.join(missing_packages)}", "warning")
+        choix_install = input("Voulez-vous installer les dépendances manquantes ? (o/n): ")
+        if choix_install.lower() == 'o':
+            installer_dependances(missing_packages)
+    else:
+        afficher_message("Toutes les dépendances sont installées", "success")
+    
+    if fichiers_manquants:
+        verifier_fichiers_essentiels.cache_clear()
+        afficher_message(f"Fichiers manquants: {', '.join(fichiers_manquants)}", "warning")
+    else:
+        afficher_message("Tous les fichiers essentiels sont présents", "success")
+    
+    input("\nAppuyez sur Entrée pour revenir au menu principal...")
+
+def action_quitter():
+    """Option 4 du menu : quitte le lanceur"""
+    afficher_message("Merci d'avoir utilisé le scraper HelloWork !", "success")
+    sys.exit(0)
+
+# Action associée à chaque choix du menu principal
+ACTIONS_MENU = {
+    "1": action_lancer,
+    "2": action_verifier,
+    "3": afficher_aide,
+    "4": action_quitter,
+}
+
 def main():
     """Fonction principale"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Lancement direct, sans menu
+    if "--direct" in sys.argv[1:]:
+        if not preparer_lancement():
+            sys.exit(1)
+        lancer_scraper()
+        return
+    
+    if os.name == 'nt':
+        # Active l'interprétation des séquences ANSI dans l'ancienne console Windows
+        os.system('')
+    effacer_ecran()
     
     while True:
         choix = afficher_menu()
         
-        if choix == "1":
-            # Vérifier les dépendances avant de lancer
-            missing_packages = verifier_dependances()
-            if missing_packages:
-                if not installer_dependances(missing_packages):
-                    afficher_message("Impossible de continuer sans les dépendances requises", "error")
-                    time.sleep(2)
-                    continue
-            
-            # Vérifier les fichiers essentiels
-            fichiers_manquants = verifier_fichiers_essentiels()
-            if fichiers_manquants:
-                afficher_message(f"Fichiers manquants: {', '.join(fichiers_manquants)}", "error")
-                afficher_message("Veuillez créer ou restaurer ces fichiers avant de continuer", "warning")
-                time.sleep(3)
-                continue
-            
-            # Lancer le scraper
-            lancer_scraper()
-            input("\nAppuyez sur Entrée pour revenir au menu principal...")
-            
-        elif choix == "2":
-            # Vérifier l'environnement
-            afficher_message("Vérification de l'environnement...", "info")
-            
-            # Vérifier Python
-            python_version = sys.version.split()[0]
-            afficher_message(f"Version de Python: {python_version}", "info")
-            
-            # Vérifier les dépendances
-            missing_packages = verifier_dependances()
-            if missing_packages:
-                afficher_message(f"Dépendances manquantes: {', '.join(missing_packages)}", "warning")
-                choix_install = input("Voulez-vous installer les dépendances manquantes ? (o/n): ")
-                if choix_install.lower() == 'o':
-                    installer_dependances(missing_packages)
-            else:
-                afficher_message("Toutes les dépendances sont installées", "success")
-            
-            # Vérifier les fichiers essentiels
-            fichiers_manquants = verifier_fichiers_essentiels()
-            if fichiers_manquants:
-                afficher_message(f"Fichiers manquants: {', '.join(fichiers_manquants)}", "warning")
-            else:
-                afficher_message("Tous les fichiers essentiels sont présents", "success")
-            
-            input("\nAppuyez sur Entrée pour revenir au menu principal...")
-            
-        elif choix == "3":
-            # Afficher l'aide
-            afficher_aide()
-            
-        elif choix == "4":
-            # Quitter
-            afficher_message("Merci d'avoir utilisé le scraper HelloWork !", "success")
-            sys.exit(0)
-            
-        else:
+        action = ACTIONS_MENU.get(choix)
+        if action is None:
             afficher_message("Choix invalide. Veuillez choisir une option entre 1 et 4.", "warning")
             time.sleep(1)
+        else:
+            action()
         
-        os.system('cls' if os.name == 'nt' else 'clear')
+        effacer_ecran()
 
 if __name__ == "__main__":
     try: